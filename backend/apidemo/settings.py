@@ -122,10 +122,13 @@ SENSITIVE_PATH_PATTERNS = env_csv(
 
 SECURITY_ALERT_EMAILS = env_csv("SECURITY_ALERT_EMAILS", "")
 SECURITY_ALERT_MIN_LEVEL = os.getenv("SECURITY_ALERT_MIN_LEVEL", "ERROR").upper()
+SECURITY_ALERT_ASYNC = env_bool("SECURITY_ALERT_ASYNC", True)
+SECURITY_ALERT_QUEUE_SIZE = int(os.getenv("SECURITY_ALERT_QUEUE_SIZE", "1000"))
 SECURITY_LOG_FILE = os.getenv("SECURITY_LOG_FILE", "")
 SECURITY_LOG_LEVEL = os.getenv("SECURITY_LOG_LEVEL", "INFO").upper()
 SECURITY_FAILED_LOGIN_THRESHOLD = int(os.getenv("SECURITY_FAILED_LOGIN_THRESHOLD", "5"))
 SECURITY_FAILED_LOGIN_WINDOW_SECONDS = int(os.getenv("SECURITY_FAILED_LOGIN_WINDOW_SECONDS", "900"))
+SECURITY_ADMIN_LOG_SKIP_USER_IDS = env_csv("SECURITY_ADMIN_LOG_SKIP_USER_IDS", "")
 SECURITY_SUSPICIOUS_PATH_KEYWORDS = env_csv(
     "SECURITY_SUSPICIOUS_PATH_KEYWORDS",
     "wp-login,wp-admin,phpmyadmin,.git/,server-status,.env",
@@ -230,10 +233,7 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "core.middleware.APIInputValidationMiddleware",
-    "core.middleware.SessionIdleTimeoutMiddleware",
-    "core.middleware.AdminAccessControlMiddleware",
-    "core.middleware.SecurityMonitoringMiddleware",
-    "core.middleware.APIInputValidationMiddleware",
+    "core.middleware.CombinedSecurityMiddleware",
     "core.middleware.APIKeyMiddleware",
     "allauth.account.middleware.AccountMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -343,6 +343,8 @@ QUIZ_AUTO_SEED_SAMPLE = env_bool("QUIZ_AUTO_SEED_SAMPLE", DEBUG)
 
 # Email
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "SkinMatch <no-reply@skinmatch.local>")
+# Send new Skin Fact announcements from a background thread after the topic commits.
+NEWSLETTER_ANNOUNCE_ASYNC = env_bool("NEWSLETTER_ANNOUNCE_ASYNC", True)
 EMAIL_BACKEND = os.getenv(
     "EMAIL_BACKEND",
     "django.core.mail.backends.console.EmailBackend",
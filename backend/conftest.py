@@ -0,0 +1,13 @@
+import pytest
+from django.conf import settings
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix):
+    # Test databases are thrown away after the run, so there is no point waiting
+    # for Postgres to flush WAL on every commit (migrations, TransactionTestCase).
+    for config in settings.DATABASES.values():
+        if config.get("ENGINE") != "django.db.backends.postgresql":
+            continue
+        options = config.setdefault("OPTIONS", {})
+        options["options"] = f"{options.get('options', '')} -c synchronous_commit=off".strip()
@@ -1101,7 +1101,7 @@ def facts_by_section(request, section: str, limit: int = 12, offset: int = 0, se
     # For logged-in users, try SkinProfile first, then fall back to latest completed session
     if not profile_data and user:
         latest_profile = (
-            SkinProfile.objects.filter(user=user, is_latest=True)
+            SkinProfile.objects.without_snapshots().filter(user=user, is_latest=True)
             .order_by("-created_at")
             .first()
         )
@@ -1198,7 +1198,7 @@ def recommended_facts(request, limit: int = 4, session_id: Optional[str] = None)
     if not profile_data and user:
         # Try to get from SkinProfile (persisted profile with is_latest=True)
         latest_profile = (
-            SkinProfile.objects.filter(user=user, is_latest=True)
+            SkinProfile.objects.without_snapshots().filter(user=user, is_latest=True)
             .order_by("-created_at")
             .first()
         )
@@ -1462,6 +1462,12 @@ class WishlistProductOut(Schema):
     saved_at: datetime
 
 
+WISHLIST_PRODUCT_FIELDS = tuple(
+    f"product__{name}"
+    for name in ("slug", "name", "brand", "category", "price", "currency", "image", "product_url")
+)
+
+
 def _serialize_wishlist_item(item: WishlistItem) -> dict:
     p: Product = item.product
     return {
@@ -1484,8 +1490,10 @@ def list_wishlist(request, limit: int = 100, offset: int = 0):
     limit = max(1, min(limit, 200))
     qs = (
         WishlistItem.objects
-        .select_related("product")
         .filter(user=user, product__is_active=True)
+        # The card only needs a few product columns; skip the long text fields.
+        .select_related("product")
+        .only("created_at", "product__id", *WISHLIST_PRODUCT_FIELDS)
         .order_by("-created_at")
     )
     items = list(qs[offset: offset + limit])
@@ -1508,7 +1516,7 @@ def add_to_wishlist(request, payload: WishlistAddIn):
 def remove_from_wishlist(request, product_id: uuid.UUID):
     user: User = request.auth
     try:
-        item = WishlistItem.objects.select_related("product").get(user=user, product_id=product_id)
+        item = WishlistItem.objects.get(user=user, product_id=product_id)
     except WishlistItem.DoesNotExist:
         return {"ok": True, "status": "not_present"}
 
@@ -1554,7 +1562,7 @@ def _keywords_for_user(user) -> list[str]:
     if not user:
         return []
     profile = (
-        SkinProfile.objects.filter(user=user, is_latest=True)
+        SkinProfile.objects.without_snapshots().filter(user=user, is_latest=True)
         .order_by("-created_at")
         .first()
     )
@@ -1647,7 +1655,7 @@ def recommended_facts(request, limit: int = 4, session_id: Optional[str] = None)
     if not profile_data and user:
         # Try to get from SkinProfile (persisted profile with is_latest=True)
         latest_profile = (
-            SkinProfile.objects.filter(user=user, is_latest=True)
+            SkinProfile.objects.without_snapshots().filter(user=user, is_latest=True)
             .order_by("-created_at")
             .first()
         )
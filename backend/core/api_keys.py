@@ -4,7 +4,7 @@ import hashlib
 from django.utils import timezone
 
 from .models import APIClient
-from .security_utils import parse_ip_networks
+from .security_utils import ParsedNetworks, parse_ip_networks
 
 
 def _hash_key(raw_key: str) -> str:
@@ -18,7 +18,7 @@ def get_api_client_from_key(raw_key: str) -> APIClient | None:
     return APIClient.objects.filter(key_hash=digest, is_active=True).first()
 
 
-def allowed_networks_for(client: APIClient) -> list:
+def allowed_networks_for(client: APIClient) -> ParsedNetworks:
     return parse_ip_networks(client.allowed_ips or [])
 
 
@@ -1,13 +1,24 @@
 import uuid
 from typing import Tuple
 
+import requests
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Case, Q, When
+from django.utils.crypto import get_random_string
+from django.utils.text import slugify
 from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token as google_id_token
 
+from .models import UserProfile
+
 User = get_user_model()
 
+# Shared transport so the TLS connection to Google's cert endpoint is reused
+# across logins instead of being re-established on every token check.
+_GOOGLE_REQUEST = google_requests.Request(session=requests.Session())
+
 
 def authenticate_google_id_token(id_token: str) -> Tuple[User, bool, str]:
     allowed_client_ids = [
@@ -24,7 +35,7 @@ def authenticate_google_id_token(id_token: str) -> Tuple[User, bool, str]:
     try:
         idinfo = google_id_token.verify_oauth2_token(
             id_token,
-            google_requests.Request(),
+            _GOOGLE_REQUEST,
             audience=allowed_client_ids,
         )
     except ValueError as exc:
@@ -35,50 +46,56 @@ def authenticate_google_id_token(id_token: str) -> Tuple[User, bool, str]:
     if not sub or not email:
         raise ValueError("Google account payload missing required fields")
 
-    user = None
     created = False
 
-    from .models import UserProfile  # local import to avoid circular
-
-    try:
-        profile = UserProfile.objects.select_related("user").get(google_sub=sub)
-        user = profile.user
-    except UserProfile.DoesNotExist:
-        user = User.objects.filter(email__iexact=email).first()
-
-    if not user:
-        base_username = idinfo.get("name") or email.split("@")[0]
-        username = _generate_unique_username(base_username)
-        from django.utils.crypto import get_random_string
-
-        password = get_random_string(32)
-        user = User.objects.create_user(
-            username=username,
-            email=email,
-            password=password,
-            first_name=idinfo.get("given_name", ""),
-            last_name=idinfo.get("family_name", ""),
+    with transaction.atomic():
+        # One lookup covers both the linked-account and the email-match case;
+        # a profile already bound to this Google subject wins over an email match.
+        profile = (
+            UserProfile.objects.select_related("user")
+            .select_for_update()
+            .filter(Q(google_sub=sub) | Q(user__email__iexact=email))
+            .order_by(Case(When(google_sub=sub, then=0), default=1), "user_id")
+            .first()
         )
-        created = True
-
-    profile, _ = UserProfile.objects.get_or_create(user=user)
-    if not profile.google_sub:
-        profile.google_sub = sub
-    if idinfo.get("email_verified") and not profile.is_verified:
-        profile.is_verified = True
-    profile.save()
 
-    if not user.email:
-        user.email = email
-        user.save(update_fields=["email"])
+        if profile is not None:
+            user = profile.user
+        else:
+            user = User.objects.filter(email__iexact=email).first()
+            if not user:
+                base_username = idinfo.get("name") or email.split("@")[0]
+                username = _generate_unique_username(base_username)
+                password = get_random_string(32)
+                user = User.objects.create_user(
+                    username=username,
+                    email=email,
+                    password=password,
+                    first_name=idinfo.get("given_name", ""),
+                    last_name=idinfo.get("family_name", ""),
+                )
+                created = True
+            profile, _ = UserProfile.objects.get_or_create(user=user)
+
+        dirty_fields = []
+        if not profile.google_sub:
+            profile.google_sub = sub
+            dirty_fields.append("google_sub")
+        if idinfo.get("email_verified") and not profile.is_verified:
+            profile.is_verified = True
+            dirty_fields.append("is_verified")
+        if dirty_fields:
+            profile.save(update_fields=[*dirty_fields, "updated_at"])
+
+        if not user.email:
+            user.email = email
+            user.save(update_fields=["email"])
 
     message = "Account created via Google" if created else "Login successful"
     return user, created, message
 
 
 def _generate_unique_username(base: str) -> str:
-    from django.utils.text import slugify
-
     candidate = slugify(base) or "user"
     original = candidate
     suffix = 1
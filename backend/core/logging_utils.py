@@ -5,6 +5,8 @@ import logging
 from datetime import datetime, timezone
 from typing import Any
 
+_EXTRA_FIELDS = ("event_type", "severity", "metadata", "request_id")
+
 
 class JsonLogFormatter(logging.Formatter):
     """
@@ -18,10 +20,11 @@ class JsonLogFormatter(logging.Formatter):
             "logger": record.name,
             "message": record.getMessage(),
         }
-        extra_fields = ("event_type", "severity", "metadata", "request_id")
-        for field in extra_fields:
-            if hasattr(record, field):
-                payload[field] = getattr(record, field)
+        # ``extra=`` values land in the record's __dict__; read them directly.
+        record_dict = record.__dict__
+        for field in _EXTRA_FIELDS:
+            if field in record_dict:
+                payload[field] = record_dict[field]
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
         if record.stack_info:
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 from typing import Any, Iterable, List, Tuple
 
 from django.conf import settings
-from django.core.files.storage import Storage
+from django.core.files.storage import FileSystemStorage, Storage
 from django.core.management.base import BaseCommand, CommandParser
 from django.utils import timezone
 
@@ -14,6 +15,7 @@ from core.models import SkinFactTopic
 DATA_DIR = Path(settings.BASE_DIR).parent / "data"
 DEFAULT_SEED_PATH = DATA_DIR / "skin_facts_seed.json"
 DEFAULT_MEDIA_DIR = DATA_DIR / "skin_facts_media"
+COPY_BUFFER_SIZE = 1024 * 1024
 
 
 class Command(BaseCommand):
@@ -145,7 +147,9 @@ def _serialize_topic(topic: SkinFactTopic) -> Tuple[dict[str, Any], List[Tuple[S
     blocks_payload = []
     media_refs: List[Tuple[Storage, str]] = []
 
-    for block in topic.content_blocks.all().order_by("order"):
+    # Meta.ordering already sorts blocks by "order"; re-ordering here would bypass
+    # the prefetch and issue one query per topic.
+    for block in topic.content_blocks.all():
         image_name = block.image.name if block.image else None
         if image_name:
             media_refs.append((block.image.storage, image_name))
@@ -204,13 +208,13 @@ def _download_media_files(
 
             target = dest_root / rel_path
             target.parent.mkdir(parents=True, exist_ok=True)
-            with storage.open(rel_path, "rb") as source_file:
-                with open(target, "wb") as dest_file:
-                    if hasattr(source_file, "chunks"):
-                        for chunk in source_file.chunks():
-                            dest_file.write(chunk)
-                    else:
-                        dest_file.write(source_file.read())
+            if isinstance(storage, FileSystemStorage):
+                # Local disk: let the OS copy the file (sendfile on Linux).
+                shutil.copyfile(storage.path(rel_path), target)
+            else:
+                with storage.open(rel_path, "rb") as source_file:
+                    with open(target, "wb") as dest_file:
+                        shutil.copyfileobj(source_file, dest_file, COPY_BUFFER_SIZE)
 
             copied += 1
             stdout.write(f"✓ Downloaded: {rel_path}")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import posixpath
 from pathlib import Path
 from typing import Any, Iterable
 
@@ -58,36 +59,45 @@ class Command(BaseCommand):
         payload = json.loads(input_path.read_text(encoding="utf-8"))
         topics_data: list[dict[str, Any]] = payload.get("topics", [])
 
-        if reset:
-            self.stdout.write(self.style.WARNING("Reset flag detected – deleting existing Skin Fact topics."))
-            SkinFactTopic.objects.all().delete()
-
         imported = 0
         skipped = 0
-
-        for topic_data in topics_data:
-            try:
-                with transaction.atomic():
-                    topic = _upsert_topic(topic_data, media_dir, skip_missing)
-                    imported += 1
-                    self.stdout.write(self.style.SUCCESS(f"✓ Imported {topic.slug}"))
-            except FileNotFoundError as exc:
-                skipped += 1
-                message = f"⚠ Skipping {topic_data.get('slug')} – {exc}"
-                if skip_missing:
-                    self.stderr.write(message)
-                    continue
-                raise
-            except Exception as exc:  # pragma: no cover - generic guard rail
-                skipped += 1
-                self.stderr.write(f"✗ Failed to import {topic_data.get('slug')}: {exc}")
+        existing_media: dict[str, set[str]] = {}
+
+        # One outer transaction commits the whole import; each topic runs in a
+        # nested atomic block (a savepoint) so a failed topic only rolls back itself.
+        with transaction.atomic():
+            if reset:
+                self.stdout.write(self.style.WARNING("Reset flag detected – deleting existing Skin Fact topics."))
+                SkinFactTopic.objects.all().delete()
+
+            for topic_data in topics_data:
+                try:
+                    with transaction.atomic():
+                        topic = _upsert_topic(topic_data, media_dir, skip_missing, existing_media)
+                        imported += 1
+                        self.stdout.write(self.style.SUCCESS(f"✓ Imported {topic.slug}"))
+                except FileNotFoundError as exc:
+                    skipped += 1
+                    message = f"⚠ Skipping {topic_data.get('slug')} – {exc}"
+                    if skip_missing:
+                        self.stderr.write(message)
+                        continue
+                    raise
+                except Exception as exc:  # pragma: no cover - generic guard rail
+                    skipped += 1
+                    self.stderr.write(f"✗ Failed to import {topic_data.get('slug')}: {exc}")
 
         self.stdout.write(self.style.SUCCESS(f"Imported {imported} topic(s)."))
         if skipped:
             self.stderr.write(self.style.WARNING(f"Skipped {skipped} topic(s)."))
 
 
-def _upsert_topic(topic_data: dict[str, Any], media_dir: Path | None, skip_missing: bool) -> SkinFactTopic:
+def _upsert_topic(
+    topic_data: dict[str, Any],
+    media_dir: Path | None,
+    skip_missing: bool,
+    existing_media: dict[str, set[str]] | None = None,
+) -> SkinFactTopic:
     slug = topic_data["slug"]
     topic, _created = SkinFactTopic.objects.get_or_create(slug=slug)
 
@@ -107,7 +117,7 @@ def _upsert_topic(topic_data: dict[str, Any], media_dir: Path | None, skip_missi
 
     hero_path = topic_data.get("hero_image")
     if hero_path:
-        _copy_media_file(hero_path, media_dir, skip_missing)
+        _copy_media_file(hero_path, media_dir, skip_missing, existing_media)
         topic.hero_image.name = hero_path
 
     topic.save()
@@ -115,6 +125,7 @@ def _upsert_topic(topic_data: dict[str, Any], media_dir: Path | None, skip_missi
     # Refresh content blocks
     topic.content_blocks.all().delete()
     blocks: Iterable[dict[str, Any]] = topic_data.get("content_blocks", [])
+    new_blocks: list[SkinFactContentBlock] = []
     for block_data in blocks:
         block = SkinFactContentBlock(
             topic=topic,
@@ -123,15 +134,21 @@ def _upsert_topic(topic_data: dict[str, Any], media_dir: Path | None, skip_missi
         )
         block_image = block_data.get("image")
         if block_image:
-            _copy_media_file(block_image, media_dir, skip_missing)
+            _copy_media_file(block_image, media_dir, skip_missing, existing_media)
             block.image.name = block_image
             block.image_alt = block_data.get("image_alt") or ""
-        block.save()
+        new_blocks.append(block)
+    SkinFactContentBlock.objects.bulk_create(new_blocks)
 
     return topic
 
 
-def _copy_media_file(rel_path: str, media_dir: Path | None, skip_missing: bool) -> None:
+def _copy_media_file(
+    rel_path: str,
+    media_dir: Path | None,
+    skip_missing: bool,
+    existing_media: dict[str, set[str]] | None = None,
+) -> None:
     if not media_dir:
         return
     source = media_dir / rel_path
@@ -141,9 +158,26 @@ def _copy_media_file(rel_path: str, media_dir: Path | None, skip_missing: bool)
         raise FileNotFoundError(f"Media file not found: {source}")
 
     storage: Storage = default_storage
-    if storage.exists(rel_path):
+    if existing_media is None:
+        existing_media = {}
+    # One listdir per storage folder instead of an exists() probe per file.
+    directory, filename = posixpath.split(rel_path)
+    names = existing_media.get(directory)
+    if names is None:
+        names = existing_media[directory] = _list_storage_files(storage, directory)
+    if filename in names:
         return
 
     source.parent.mkdir(parents=True, exist_ok=True)
     with source.open("rb") as fh:
         storage.save(rel_path, File(fh))
+    names.add(filename)
+
+
+def _list_storage_files(storage: Storage, directory: str) -> set[str]:
+    try:
+        _dirs, files = storage.listdir(directory)
+    except OSError:
+        # Folder not created yet (local disk); nothing to skip.
+        return set()
+    return set(files)
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import partial
+from itertools import cycle, islice
 from typing import Iterable, List
+from uuid import UUID
 
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, make_password
 from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
 from django.utils import timezone
 
 from core.models import UserProfile, SkinProfile
+from core.sanitizers import sanitize_plain_text
 from quiz.models import Product, ProductReview, QuizSession, MatchPick
+from quiz.views import calculate_results, _persist_skin_profile
+
+User = get_user_model()
+ITERATOR_CHUNK_SIZE = 500
 
 
 class Command(BaseCommand):
@@ -17,7 +27,7 @@ class Command(BaseCommand):
         "profile information so reviewers can log in immediately."
     )
 
-    DEMO_ACCOUNTS: list[dict] = [
+    DEMO_ACCOUNTS: tuple[dict, ...] = (
         {
             "username": "skinmatch_admin",
             "email": "admin@skinmatch.demo",
@@ -268,13 +278,29 @@ class Command(BaseCommand):
                 }
             ],
         },
-    ]
+    )
 
-    REVIEW_COMMENTS = [
+    REVIEW_COMMENTS = (
         "Leaves my skin bouncy without any greasy finish.",
         "Visible glow after two weeks and the texture stays calm.",
         "Pairs perfectly with my sunscreen—zero pilling.",
-    ]
+    )
+
+    # Product columns read by the MatchPick/recommendation/review helpers below.
+    PRODUCT_FIELDS = (
+        "id",
+        "slug",
+        "name",
+        "brand",
+        "category",
+        "price",
+        "currency",
+        "image",
+        "product_url",
+        "hero_ingredients",
+        "rating",
+        "review_count",
+    )
 
     def add_arguments(self, parser: CommandParser) -> None:
         parser.add_argument(
@@ -283,14 +309,19 @@ class Command(BaseCommand):
             help="Also reset the password for each demo account to the values in this command.",
         )
 
+    @transaction.atomic
     def handle(self, *args, **options):
         reset_passwords: bool = options.get("reset_passwords", False)
-        User = get_user_model()
-        seed_timestamp = timezone.now()
+        member_role = UserProfile.Role.MEMBER
+        # One clock reading for the whole run keeps seeded timestamps consistent.
+        self._seed_now = timezone.now()
+        self._seed_now_iso = self._seed_now.isoformat()
         created_count = 0
 
         self.demo_products: List[Product] = list(
-            Product.objects.filter(is_active=True).order_by("brand", "name")[:12]
+            Product.objects.filter(is_active=True)
+            .only(*self.PRODUCT_FIELDS)
+            .order_by("brand", "name")[:12]
         )
         if not self.demo_products:
             self.stderr.write(
@@ -298,6 +329,16 @@ class Command(BaseCommand):
                     "No products found. Run `python manage.py load_sample_catalog` before seeding reviews."
                 )
             )
+        self._product_lookup = self._load_product_lookup()
+        self._missing_slugs: set[str] = set()
+        self._hero_cache: dict[UUID, list[str]] = {}
+        self._users_with_history: set[int] = set(
+            SkinProfile.objects.filter(
+                user__username__in=[account["username"] for account in self.DEMO_ACCOUNTS]
+            )
+            .values_list("user_id", flat=True)
+            .distinct()
+        )
 
         for account in self.DEMO_ACCOUNTS:
             username = account["username"]
@@ -309,37 +350,30 @@ class Command(BaseCommand):
                 "is_superuser": account.get("is_superuser", False),
                 "is_active": True,
             }
-            user, created = User.objects.get_or_create(username=username, defaults=user_defaults)
-            user_dirty = False
-
-            for field, value in user_defaults.items():
-                if getattr(user, field) != value:
-                    setattr(user, field, value)
-                    user_dirty = True
-
-            if created or reset_passwords:
+            # Callables in defaults are only resolved on insert, so PBKDF2 runs on create only.
+            user, created = User.objects.get_or_create(
+                username=username,
+                defaults={**user_defaults, "password": partial(make_password, account["password"])},
+            )
+            user_changed = [] if created else self._apply_changes(user, user_defaults)
+            # Skip re-hashing (and the write) when the stored hash already matches.
+            if reset_passwords and not created and not check_password(account["password"], user.password):
                 user.set_password(account["password"])
-                user_dirty = True
-
-            if user_dirty:
-                user.save()
+                user_changed.append("password")
+            if user_changed:
+                user.save(update_fields=user_changed)
 
             profile_payload = dict(account.get("profile", {}))
             accept_policies = profile_payload.pop("accept_policies", False)
             if accept_policies:
-                profile_payload.setdefault("terms_accepted_at", seed_timestamp)
-                profile_payload.setdefault("privacy_policy_accepted_at", seed_timestamp)
-            profile_payload.setdefault("role", UserProfile.Role.MEMBER)
+                profile_payload.setdefault("terms_accepted_at", self._seed_now)
+                profile_payload.setdefault("privacy_policy_accepted_at", self._seed_now)
+            profile_payload.setdefault("role", member_role)
 
             profile, _ = UserProfile.objects.get_or_create(user=user)
-            profile_dirty = False
-            for field, value in profile_payload.items():
-                if getattr(profile, field) != value:
-                    setattr(profile, field, value)
-                    profile_dirty = True
-
-            if profile_dirty:
-                profile.save()
+            profile_changed = self._apply_changes(profile, profile_payload)
+            if profile_changed:
+                profile.save(update_fields=[*profile_changed, "updated_at"])
 
             created_count += 1 if created else 0
             action = "created" if created else "updated"
@@ -369,11 +403,9 @@ class Command(BaseCommand):
     # ------------------------------------------------------------------ helpers
 
     def _ensure_demo_history(self, user, history_blueprints=None):
-        if user.skin_profiles.exists():
+        if user.id in self._users_with_history:
             return
 
-        from quiz.views import calculate_results, _persist_skin_profile
-
         blueprints = history_blueprints or []
         if not blueprints:
             return
@@ -387,26 +419,29 @@ class Command(BaseCommand):
                 user=user,
                 answer_snapshot=answer_snapshot,
                 profile_snapshot=profile_payload,
-                completed_at=timezone.now(),
+                completed_at=self._seed_now,
             )
             result_payload = calculate_results(session, include_products=True)
             session.result_summary = result_payload
-            session.save(update_fields=["answer_snapshot", "profile_snapshot", "completed_at", "result_summary"])
+            session.save(update_fields=["result_summary"])
             _persist_skin_profile(session, profile_payload)
 
     def _seed_manual_history(self, user, blueprint: dict):
         products_config = blueprint.get("products") or []
         if not products_config:
             return
-        profile_payload = dict(blueprint["profile"])
+        profile_payload = blueprint["profile"]
         answer_snapshot = self._build_answer_snapshot(blueprint)
-        session = QuizSession.objects.create(
+        # Unsaved session: its UUID pk is already set, so picks can reference it
+        # and the row is inserted once with the finished result_summary.
+        session = QuizSession(
             user=user,
             answer_snapshot=answer_snapshot,
             profile_snapshot=profile_payload,
-            completed_at=timezone.now(),
+            completed_at=self._seed_now,
         )
         recommendations = []
+        picks: List[MatchPick] = []
         for rank, product_cfg in enumerate(products_config, start=1):
             product = self._get_product(product_cfg.get("slug"))
             if not product:
@@ -419,66 +454,89 @@ class Command(BaseCommand):
                 rationale=product_cfg.get("rationale"),
             )
             recommendations.append(recommendation_entry)
-            MatchPick.objects.create(
-                session=session,
-                product=product,
-                product_slug=product.slug,
-                product_name=product.name,
-                brand=product.brand,
-                category=product.category,
-                rank=rank,
-                score=score,
-                ingredients=recommendation_entry.get("ingredients", []),
-                price_snapshot=product.price,
-                currency=product.currency,
-                rationale=product_cfg.get("rationale") or {},
-                image_url=product.image or "",
-                product_url=product.product_url or "",
+            picks.append(
+                MatchPick(
+                    session=session,
+                    product=product,
+                    product_slug=product.slug,
+                    product_name=product.name,
+                    brand=product.brand,
+                    category=product.category,
+                    rank=rank,
+                    score=score,
+                    ingredients=recommendation_entry.get("ingredients", []),
+                    price_snapshot=product.price,
+                    currency=product.currency,
+                    rationale=product_cfg.get("rationale") or {},
+                    image_url=product.image or "",
+                    product_url=product.product_url or "",
+                )
             )
 
         summary = {
-            "primary_concerns": list(profile_payload.get("primary_concerns") or []),
+            "primary_concerns": profile_payload.get("primary_concerns") or [],
             "top_ingredients": blueprint.get("top_ingredients")
             or [item.get("name") for item in blueprint.get("ingredients_prioritize", [])],
             "ingredients_to_prioritize": blueprint.get("ingredients_prioritize", []),
             "ingredients_caution": blueprint.get("ingredients_caution", []),
             "category_breakdown": blueprint.get("category_breakdown", {}),
-            "generated_at": timezone.now().isoformat(),
+            "generated_at": self._seed_now_iso,
             "score_version": "demo-v1",
         }
         session.result_summary = {
             "summary": summary,
-            "strategy_notes": list(blueprint.get("strategy_notes") or []),
+            "strategy_notes": blueprint.get("strategy_notes") or [],
             "recommendations": recommendations,
         }
-        session.save(update_fields=["answer_snapshot", "profile_snapshot", "completed_at", "result_summary"])
-
-        from quiz.views import _persist_skin_profile
+        session.save(force_insert=True)
+        MatchPick.objects.bulk_create(picks)
 
         _persist_skin_profile(session, profile_payload)
 
+    @staticmethod
+    def _apply_changes(instance, values: dict) -> list[str]:
+        changed = []
+        for field, value in values.items():
+            if getattr(instance, field) != value:
+                setattr(instance, field, value)
+                changed.append(field)
+        return changed
+
+    def _load_product_lookup(self) -> dict[str, Product]:
+        slugs = {
+            product_cfg["slug"].strip().lower()
+            for account in self.DEMO_ACCOUNTS
+            for blueprint in account.get("history") or []
+            for product_cfg in blueprint.get("products") or []
+            if product_cfg.get("slug")
+        }
+        if not slugs:
+            return {}
+        queryset = Product.objects.filter(slug__in=slugs, is_active=True).only(*self.PRODUCT_FIELDS)
+        # Stream rows straight into the lookup rather than through a result cache.
+        return {product.slug: product for product in queryset.iterator(chunk_size=ITERATOR_CHUNK_SIZE)}
+
     def _get_product(self, slug: str | None) -> Product | None:
         if not slug:
             return None
-        slug = slug.strip().lower()
-        if not hasattr(self, "_product_lookup"):
-            self._product_lookup = {}
-        if slug in self._product_lookup:
-            return self._product_lookup[slug]
-        try:
-            product = Product.objects.get(slug=slug, is_active=True)
-        except Product.DoesNotExist:
-            product = None
+        product = self._product_lookup.get(slug)
+        if product is None:
+            # Blueprint slugs are already normalized; only clean up on a miss.
+            slug = slug.strip().lower()
+            product = self._product_lookup.get(slug)
+        if product is None and slug not in self._missing_slugs:
+            self._missing_slugs.add(slug)
             self.stderr.write(self.style.WARNING(f"Missing product seed for slug '{slug}'"))
-        self._product_lookup[slug] = product
         return product
 
     def _serialize_product_reco(self, product: Product, rank: int, score: float, rationale: dict | None = None) -> dict:
-        hero = [
-            part.strip()
-            for part in (product.hero_ingredients or "").split(",")
-            if part and part.strip()
-        ]
+        hero = self._hero_cache.get(product.id)
+        if hero is None:
+            hero = self._hero_cache[product.id] = [
+                part.strip()
+                for part in (product.hero_ingredients or "").split(",")
+                if part and part.strip()
+            ]
         price_value = float(product.price) if product.price is not None else None
         rating_value = float(product.rating) if product.rating is not None else 0
         return {
@@ -516,28 +574,33 @@ class Command(BaseCommand):
         if not self.demo_products:
             return []
         pool = self.demo_products
-        results: List[Product] = []
-        for i in range(count):
-            idx = (offset + i) % len(pool)
-            results.append(pool[idx])
-        return results
+        start = offset % len(pool)
+        return list(islice(cycle(pool), start, start + count))
 
     def _ensure_demo_reviews(self, user):
         if not self.demo_products:
             return
-        comment_templates = list(self.REVIEW_COMMENTS)
+        comment_templates = self.REVIEW_COMMENTS
         products = self._pick_products(2, offset=len(user.username))
-        for idx, product in enumerate(products):
-            comment = comment_templates[idx % len(comment_templates)]
-            rating = min(5, 4 + idx)
-            defaults = {
-                "rating": rating,
-                "comment": f"{comment} ({product.name})",
-                "is_public": True,
-                "is_anonymous": False,
-            }
-            ProductReview.objects.update_or_create(
+        reviews = [
+            ProductReview(
                 product=product,
                 user=user,
-                defaults=defaults,
+                rating=min(5, 4 + idx),
+                comment=sanitize_plain_text(
+                    f"{comment_templates[idx % len(comment_templates)]} ({product.name})"
+                ),
+                is_public=True,
+                is_anonymous=False,
             )
+            for idx, product in enumerate(products)
+        ]
+        ProductReview.objects.bulk_create(
+            reviews,
+            update_conflicts=True,
+            unique_fields=["product", "user"],
+            update_fields=["rating", "comment", "is_public", "is_anonymous", "updated_at"],
+        )
+        # bulk_create bypasses ProductReview.save(), so refresh the cached stats here.
+        for product_id in {product.id for product in products}:
+            ProductReview.recompute_product_stats(product_id)
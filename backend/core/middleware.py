@@ -6,21 +6,56 @@ import json
 import logging
 import math
 import re
-from typing import Iterable
+import time
+from functools import lru_cache
+from typing import Iterable, NamedTuple
 
 from django.conf import settings
 from django.contrib.auth import logout
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.http import HttpResponseForbidden, HttpResponseNotFound, HttpResponseRedirect, JsonResponse
-from django.utils import timezone
 
 from .api_keys import allowed_networks_for, get_api_client_from_key, touch_api_client_usage
 from .sanitizers import sanitize_plain_text
 from .security_events import record_security_event
-from .security_utils import bump_counter, get_client_ip, ip_in_networks
+from .security_utils import ParsedNetworks, bump_counter, get_client_ip, ip_in_networks
 
 
 logger = logging.getLogger(__name__)
 
+_UNSET = object()
+
+
+class _PrefixConfig(NamedTuple):
+    static: tuple[str, ...]
+    session_exempt: tuple[str, ...]
+    session_api: tuple[str, ...]
+
+
+@lru_cache(maxsize=1)
+def _prefix_config() -> _PrefixConfig:
+    """
+    Path prefixes shared by the session and monitoring middlewares. Built once per
+    process (before workers fork, when preloaded) and reset when settings change.
+    """
+    return _PrefixConfig(
+        static=tuple(
+            prefix
+            for prefix in (getattr(settings, "STATIC_URL", None), getattr(settings, "MEDIA_URL", None))
+            if prefix
+        ),
+        session_exempt=tuple(getattr(settings, "SESSION_IDLE_TIMEOUT_EXEMPT_PATHS", [])),
+        session_api=tuple(
+            prefix for prefix in getattr(settings, "SESSION_TIMEOUT_API_PREFIXES", ["/api/"]) if prefix
+        ),
+    )
+
+
+@receiver(setting_changed)
+def _reset_prefix_config(**kwargs):
+    _prefix_config.cache_clear()
+
 
 class SecurityHeadersMiddleware:
     """
@@ -31,55 +66,64 @@ class SecurityHeadersMiddleware:
     missing headers (e.g., when another upstream overwrites them).
     """
 
+    # Relaxed CSP for the interactive API documentation.
+    DOCS_CSP = (
+        "default-src 'self'; "
+        "img-src 'self' data: blob: https:; "
+        "media-src 'self' data: blob:; "
+        "script-src 'self' 'unsafe-inline' 'unsafe-eval' https:; "
+        "style-src 'self' 'unsafe-inline' https:; "
+        "font-src 'self' data: https:; "
+        "connect-src 'self' https:; "
+    )
+
     def __init__(self, get_response):
         self.get_response = get_response
+        # Settings are fixed for the process lifetime; resolve header values once.
+        self.csp = getattr(settings, "CONTENT_SECURITY_POLICY", "").strip()
+        self.csp_header = (
+            "Content-Security-Policy-Report-Only"
+            if getattr(settings, "CONTENT_SECURITY_POLICY_REPORT_ONLY", False)
+            else "Content-Security-Policy"
+        )
+        self.referrer_policy = getattr(settings, "SECURE_REFERRER_POLICY", "").strip()
+        self.nosniff = bool(getattr(settings, "SECURE_CONTENT_TYPE_NOSNIFF", False))
+        self.x_frame_options = getattr(settings, "X_FRAME_OPTIONS", "").strip()
+        self.hsts_value = self._build_hsts_value()
+        # Headers only backfilled when the view did not set them; empties are skipped.
+        self.default_headers = tuple(
+            (name, value)
+            for name, value in (
+                ("Referrer-Policy", self.referrer_policy),
+                ("X-Content-Type-Options", "nosniff" if self.nosniff else ""),
+                ("X-Frame-Options", self.x_frame_options),
+                ("Strict-Transport-Security", self.hsts_value),
+            )
+            if value
+        )
+
+    @staticmethod
+    def _build_hsts_value() -> str:
+        hsts_seconds = int(getattr(settings, "SECURE_HSTS_SECONDS", 0))
+        if not hsts_seconds:
+            return ""
+        hsts_value = f"max-age={hsts_seconds}"
+        if getattr(settings, "SECURE_HSTS_INCLUDE_SUBDOMAINS", False):
+            hsts_value += "; includeSubDomains"
+        if getattr(settings, "SECURE_HSTS_PRELOAD", False):
+            hsts_value += "; preload"
+        return hsts_value
 
     def __call__(self, request):
         response = self.get_response(request)
 
-        # Use relaxed CSP for API documentation
-        if request.path.startswith('/api/docs'):
-            csp = (
-                "default-src 'self'; "
-                "img-src 'self' data: blob: https:; "
-                "media-src 'self' data: blob:; "
-                "script-src 'self' 'unsafe-inline' 'unsafe-eval' https:; "
-                "style-src 'self' 'unsafe-inline' https:; "
-                "font-src 'self' data: https:; "
-                "connect-src 'self' https:; "
-            )
-        else:
-            csp = getattr(settings, "CONTENT_SECURITY_POLICY", "").strip()
-        
+        csp = self.DOCS_CSP if request.path_info.startswith('/api/docs') else self.csp
         if csp:
-            header = (
-                "Content-Security-Policy-Report-Only"
-                if getattr(settings, "CONTENT_SECURITY_POLICY_REPORT_ONLY", False)
-                else "Content-Security-Policy"
-            )
-            response[header] = csp
+            response[self.csp_header] = csp
 
-        referrer_policy = getattr(settings, "SECURE_REFERRER_POLICY", "").strip()
-        if referrer_policy and "Referrer-Policy" not in response:
-            response["Referrer-Policy"] = referrer_policy
-
-        if getattr(settings, "SECURE_CONTENT_TYPE_NOSNIFF", False) and (
-            "X-Content-Type-Options" not in response
-        ):
-            response["X-Content-Type-Options"] = "nosniff"
-
-        x_frame_options = getattr(settings, "X_FRAME_OPTIONS", "").strip()
-        if x_frame_options and "X-Frame-Options" not in response:
-            response["X-Frame-Options"] = x_frame_options
-
-        hsts_seconds = int(getattr(settings, "SECURE_HSTS_SECONDS", 0))
-        if hsts_seconds and "Strict-Transport-Security" not in response:
-            hsts_value = f"max-age={hsts_seconds}"
-            if getattr(settings, "SECURE_HSTS_INCLUDE_SUBDOMAINS", False):
-                hsts_value += "; includeSubDomains"
-            if getattr(settings, "SECURE_HSTS_PRELOAD", False):
-                hsts_value += "; preload"
-            response["Strict-Transport-Security"] = hsts_value
+        headers = response.headers
+        for name, value in self.default_headers:
+            headers.setdefault(name, value)
 
         return response
 
@@ -95,7 +139,7 @@ class SensitiveFileProtectionMiddleware:
         self.patterns = [pattern.strip().lower() for pattern in patterns if pattern.strip()]
 
     def __call__(self, request):
-        path = (request.path or "").lower()
+        path = (request.path_info or "").lower()
         if path and self._matches_protected_pattern(path):
             record_security_event(
                 "filesystem.protected_path",
@@ -129,6 +173,9 @@ class SensitiveFileProtectionMiddleware:
 class SessionIdleTimeoutMiddleware:
     """
     Enforces idle session expiration to mitigate hijacked or abandoned sessions.
+
+    Must run after SessionMiddleware and AuthenticationMiddleware, which
+    guarantee ``request.session`` and ``request.user``.
     """
 
     SESSION_KEY = "_last_activity_ts"
@@ -136,80 +183,87 @@ class SessionIdleTimeoutMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
         self.timeout_seconds = int(getattr(settings, "SESSION_IDLE_TIMEOUT_SECONDS", 0))
-        self.exempt_paths = tuple(getattr(settings, "SESSION_IDLE_TIMEOUT_EXEMPT_PATHS", []))
-        api_prefixes = getattr(settings, "SESSION_TIMEOUT_API_PREFIXES", ["/api/"])
-        self.api_prefixes = tuple(prefix for prefix in api_prefixes if prefix)
+        prefixes = _prefix_config()
+        self.exempt_paths = prefixes.session_exempt
+        self.api_prefixes = prefixes.session_api
         self.redirect_url = getattr(settings, "SESSION_TIMEOUT_REDIRECT_URL", "")
-        static_candidates = []
-        for attr in ("STATIC_URL", "MEDIA_URL"):
-            prefix = getattr(settings, attr, None)
-            if prefix:
-                static_candidates.append(prefix)
-        self.static_prefixes = tuple(static_candidates)
+        self.static_prefixes = prefixes.static
+        # Only rewrite the timestamp once it drifts by ~5% of the window so most
+        # requests leave the session unmodified and skip the session-store write.
+        self.touch_interval = max(1, self.timeout_seconds // 20)
 
     def __call__(self, request):
-        if self._should_enforce(request):
-            timeout_response = self._check_expiry(request)
-            if timeout_response:
-                return timeout_response
-            self._touch_session(request)
+        if request.path_info.startswith(self.static_prefixes):
+            return self.get_response(request)
+        timeout_response = self.check_request(request)
+        if timeout_response is not None:
+            return timeout_response
+        return self.get_response(request)
 
-        response = self.get_response(request)
-        return response
+    def check_request(self, request):
+        """Expire or refresh the idle timer; returns a response only on timeout."""
+        if not self._should_enforce(request):
+            return None
+        timeout_response = self._check_expiry(request)
+        if timeout_response:
+            return timeout_response
+        self._touch_session(request)
+        return None
 
     def _should_enforce(self, request) -> bool:
         if self.timeout_seconds <= 0:
             return False
-        user = getattr(request, "user", None)
-        if not user or not getattr(user, "is_authenticated", False):
-            return False
-        if not hasattr(request, "session"):
-            return False
-        path = request.path or ""
-        if any(path.startswith(prefix) for prefix in self.static_prefixes):
+        if not request.user.is_authenticated:
             return False
-        if any(path.startswith(prefix) for prefix in self.exempt_paths):
+        if (request.path_info or "").startswith(self.exempt_paths):
             return False
         return True
 
-    def _check_expiry(self, request):
+    def _last_activity(self, request) -> float | None:
         last_activity = request.session.get(self.SESSION_KEY)
-        if last_activity is None:
-            return None
+        # _touch_session always stores a float; only coerce legacy/foreign values.
+        if last_activity is None or type(last_activity) is float:
+            return last_activity
         try:
-            last_activity = float(last_activity)
+            return float(last_activity)
         except (TypeError, ValueError):
-            last_activity = 0.0
-        now_ts = timezone.now().timestamp()
+            return 0.0
+
+    def _check_expiry(self, request):
+        last_activity = self._last_activity(request)
+        if last_activity is None:
+            return None
+        now_ts = time.time()
         if now_ts - last_activity > self.timeout_seconds:
             return self._handle_timeout(request)
         return None
 
     def _touch_session(self, request):
-        request.session[self.SESSION_KEY] = timezone.now().timestamp()
+        now_ts = time.time()
+        last_activity = self._last_activity(request)
+        if last_activity is not None and now_ts - last_activity < self.touch_interval:
+            return
+        request.session[self.SESSION_KEY] = now_ts
 
     def _handle_timeout(self, request):
-        user = getattr(request, "user", None)
-        if user and getattr(user, "is_authenticated", False):
-            logout(request)
-        elif hasattr(request, "session"):
-            request.session.flush()
-        metadata = {"user_id": getattr(user, "pk", None), "path": request.path, "ip": get_client_ip(request)}
+        user_id = request.user.pk
+        logout(request)
+        metadata = {"user_id": user_id, "path": request.path, "ip": get_client_ip(request)}
         record_security_event(
             "session.timeout",
             "info",
             f"Idle session cleared for path {request.path}",
             metadata=metadata,
         )
-        if self._is_api_request(request.path or ""):
+        if self._is_api_request(request.path_info or ""):
             return JsonResponse({"detail": "Session expired"}, status=401)
         target = self.redirect_url
         if not target:
-            target = "/admin/login/?timeout=1" if (request.path or "").startswith("/admin/") else "/login?timeout=1"
+            target = "/admin/login/?timeout=1" if (request.path_info or "").startswith("/admin/") else "/login?timeout=1"
         return HttpResponseRedirect(target)
 
     def _is_api_request(self, path: str) -> bool:
-        return any(path.startswith(prefix) for prefix in self.api_prefixes)
+        return path.startswith(self.api_prefixes)
 
 
 class AdminAccessControlMiddleware:
@@ -223,12 +277,16 @@ class AdminAccessControlMiddleware:
         self.path_prefixes = tuple(
             prefix for prefix in getattr(settings, "ADMIN_PROTECTED_PATH_PREFIXES", ["/admin/"]) if prefix
         )
-        self.allowed_roles = {
+        # str.startswith takes either form; the usual single "/admin/" prefix is
+        # matched as a plain string rather than a one-element tuple.
+        self._path_match = self.path_prefixes[0] if len(self.path_prefixes) == 1 else self.path_prefixes
+        self.allowed_roles = frozenset(
             role.lower()
             for role in getattr(settings, "ADMIN_ALLOWED_ROLES", [])
             if role
-        }
+        )
         self.allowed_networks = self._build_networks(getattr(settings, "ADMIN_ALLOWED_IPS", []))
+        self._allowed_ranges = ParsedNetworks.from_networks(self.allowed_networks)
         self.country_headers = tuple(
             header for header in getattr(
                 settings,
@@ -246,26 +304,34 @@ class AdminAccessControlMiddleware:
             )
             if header
         )
-        self.allowed_countries = {
+        self.allowed_countries = frozenset(
             code.upper() for code in getattr(settings, "ADMIN_ALLOWED_COUNTRIES", []) if code
-        }
+        )
 
     def __call__(self, request):
-        if not self._is_protected_path(request.path or ""):
-            return self.get_response(request)
+        rejection = self.check_request(request)
+        if rejection is not None:
+            return rejection
+        return self.get_response(request)
 
-        denial_reason = (
+    def check_request(self, request):
+        """Returns a rejection response for denied admin requests, otherwise None."""
+        if not self._is_protected_path(request.path_info or ""):
+            return None
+        denial_reason = self._denial_reason(request)
+        if denial_reason:
+            return self._reject(request, denial_reason)
+        return None
+
+    def _denial_reason(self, request) -> str | None:
+        return (
             self._enforce_ip_whitelist(request)
             or self._enforce_country_restriction(request)
             or self._enforce_role_restriction(request)
         )
-        if denial_reason:
-            return self._reject(request, denial_reason)
-
-        return self.get_response(request)
 
     def _is_protected_path(self, path: str) -> bool:
-        return any(path.startswith(prefix) for prefix in self.path_prefixes)
+        return path.startswith(self._path_match)
 
     def _build_networks(
         self, entries: Iterable[str]
@@ -279,8 +345,7 @@ class AdminAccessControlMiddleware:
                     network = ipaddress.ip_network(raw, strict=False)
                 else:
                     ip_obj = ipaddress.ip_address(raw)
-                    mask = 32 if ip_obj.version == 4 else 128
-                    network = ipaddress.ip_network(f"{ip_obj}/{mask}", strict=False)
+                    network = ipaddress.ip_network((ip_obj, ip_obj.max_prefixlen))
                 networks.append(network)
             except ValueError:
                 logger.warning("Ignoring invalid admin IP entry: %s", raw)
@@ -292,22 +357,35 @@ class AdminAccessControlMiddleware:
         client_ip = self._get_client_ip(request)
         if client_ip is None:
             return "Unable to determine client IP for admin request"
-        for network in self.allowed_networks:
-            if client_ip in network:
-                return None
+        if self._allowed_ranges.contains(client_ip):
+            return None
         return f"IP {client_ip} is not allowed to access admin paths"
 
     def _get_client_ip(self, request):
+        # Memoised per request: the whitelist check and _reject both need the parsed address.
+        cached = getattr(request, "_admin_client_ip", _UNSET)
+        if cached is _UNSET:
+            cached = self._parse_client_ip(request)
+            request._admin_client_ip = cached
+        return cached
+
+    def _parse_client_ip(self, request):
         for header in self.trusted_ip_headers:
             raw_value = request.META.get(header)
             if not raw_value:
                 continue
-            candidates = [raw_value]
-            if header != "REMOTE_ADDR":
-                candidates = [part.strip() for part in raw_value.split(",") if part.strip()]
-            for candidate in candidates:
+            # Fast path: the first entry of a forwarded list (usually the only one).
+            comma = -1 if header == "REMOTE_ADDR" else raw_value.find(",")
+            first = raw_value if comma < 0 else raw_value[:comma]
+            try:
+                return ipaddress.ip_address(first.strip())
+            except ValueError:
+                pass
+            if comma < 0:
+                continue
+            for candidate in raw_value[comma + 1 :].split(","):
                 try:
-                    return ipaddress.ip_address(candidate)
+                    return ipaddress.ip_address(candidate.strip())
                 except ValueError:
                     continue
         return None
@@ -318,6 +396,9 @@ class AdminAccessControlMiddleware:
         country = self._get_country_code(request)
         if not country:
             return "Missing country metadata for geo-restricted admin request"
+        # CDN headers are normally upper-case already; only normalise on a miss.
+        if country in self.allowed_countries:
+            return None
         country = country.upper()
         if country not in self.allowed_countries:
             return f"Country '{country}' is blocked for admin access"
@@ -331,13 +412,13 @@ class AdminAccessControlMiddleware:
         return None
 
     def _enforce_role_restriction(self, request):
-        user = getattr(request, "user", None)
-        if not user or not getattr(user, "is_authenticated", False):
+        user = request.user
+        if not user.is_authenticated:
             # Let Django admin handle the login flow.
             return None
-        if getattr(user, "is_superuser", False):
+        if user.is_superuser:
             return None
-        if not getattr(user, "is_staff", False):
+        if not user.is_staff:
             return "Staff flag required for admin access"
         if not self.allowed_roles:
             return None
@@ -345,7 +426,8 @@ class AdminAccessControlMiddleware:
         role = getattr(profile, "role", None)
         if not role:
             return "User does not have an assigned RBAC role"
-        if role.lower() not in self.allowed_roles:
+        # UserProfile.Role values are stored lower-case, so try the raw value first.
+        if role not in self.allowed_roles and role.lower() not in self.allowed_roles:
             return f"Role '{role}' is not permitted to access admin"
         return None
 
@@ -367,33 +449,59 @@ class SecurityMonitoringMiddleware:
         self.get_response = get_response
         keywords = getattr(settings, "SECURITY_SUSPICIOUS_PATH_KEYWORDS", [])
         self.keywords = tuple(k.lower() for k in keywords if k)
+        # One compiled, case-insensitive alternation scans the path in C instead of
+        # K substring checks over a lower-cased copy.
+        self.keyword_pattern = (
+            re.compile("|".join(re.escape(keyword) for keyword in self.keywords), re.IGNORECASE)
+            if self.keywords
+            else None
+        )
         codes = getattr(settings, "SECURITY_MONITOR_STATUS_CODES", None) or [401, 403, 404, 405]
-        self.status_codes = tuple(codes)
+        self.status_codes = frozenset(codes)
         self.rate_threshold = int(getattr(settings, "SECURITY_MONITOR_RATE_THRESHOLD", 25))
         self.rate_window = int(getattr(settings, "SECURITY_MONITOR_RATE_WINDOW_SECONDS", 300))
+        self.static_prefixes = _prefix_config().static
 
     def __call__(self, request):
         response = self.get_response(request)
+        if request.path_info.startswith(self.static_prefixes):
+            return response
+        self.inspect_response(request, response)
+        return response
+
+    def inspect_response(self, request, response) -> None:
         try:
             self._inspect_request(request, response)
         except Exception:  # pragma: no cover - defensive, don't break responses
             logger.exception("SecurityMonitoringMiddleware failed to inspect request")
-        return response
 
     def _inspect_request(self, request, response):
-        path = (request.path or "").lower()
-        user_agent = request.META.get("HTTP_USER_AGENT", "")
-        ip = get_client_ip(request)
-        if path and self.keywords and any(keyword in path for keyword in self.keywords):
-            record_security_event(
-                "traffic.suspicious_path",
-                "warning",
-                f"Suspicious path requested: {request.path}",
-                metadata={"path": request.path, "ip": ip, "user_agent": user_agent},
-            )
-
+        # Clean requests with an unmonitored status never need the client IP or
+        # user agent, so both are only resolved once something is worth recording.
+        if self.keyword_pattern is not None:
+            self._scan_path(request)
         status = getattr(response, "status_code", None)
-        if not status or status not in self.status_codes or not ip:
+        if status in self.status_codes:
+            self._scan_status(request, status)
+
+    def _scan_path(self, request):
+        if not self.keyword_pattern.search(request.path_info or ""):
+            return
+        path = request.path
+        record_security_event(
+            "traffic.suspicious_path",
+            "warning",
+            f"Suspicious path requested: {path}",
+            metadata={
+                "path": path,
+                "ip": get_client_ip(request),
+                "user_agent": request.META.get("HTTP_USER_AGENT", ""),
+            },
+        )
+
+    def _scan_status(self, request, status: int):
+        ip = get_client_ip(request)
+        if not ip:
             return
         cache_key = f"security:status:{status}:{ip}"
         count = bump_counter(cache_key, self.rate_window)
@@ -407,6 +515,34 @@ class SecurityMonitoringMiddleware:
             )
 
 
+class CombinedSecurityMiddleware:
+    """
+    Runs the idle-timeout, admin access and monitoring checks from a single
+    middleware frame, in the same order the three standalone classes would.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.session_timeout = SessionIdleTimeoutMiddleware(get_response)
+        self.admin_access = AdminAccessControlMiddleware(get_response)
+        self.monitoring = SecurityMonitoringMiddleware(get_response)
+        self.static_prefixes = _prefix_config().static
+
+    def __call__(self, request):
+        if request.path_info.startswith(self.static_prefixes):
+            return self.get_response(request)
+
+        early_response = self.session_timeout.check_request(request)
+        if early_response is None:
+            early_response = self.admin_access.check_request(request)
+        if early_response is not None:
+            return early_response
+
+        response = self.get_response(request)
+        self.monitoring.inspect_response(request, response)
+        return response
+
+
 class APIInputValidationMiddleware:
     """
     Performs basic payload validation (size limits, blocklist scanning) before hitting views.
@@ -422,7 +558,7 @@ class APIInputValidationMiddleware:
         self.protected_prefixes = tuple(getattr(settings, "API_PROTECTED_PATH_PREFIXES", ["/api/"]))
 
     def __call__(self, request):
-        if not self.enabled or not self._is_api_request(request.path):
+        if not self.enabled or not self._is_api_request(request.path_info):
             return self.get_response(request)
 
         if not self._inspect_request(request):
@@ -431,8 +567,7 @@ class APIInputValidationMiddleware:
         return self.get_response(request)
 
     def _is_api_request(self, path: str | None) -> bool:
-        target = path or ""
-        return any(target.startswith(prefix) for prefix in self.protected_prefixes)
+        return (path or "").startswith(self.protected_prefixes)
 
     def _inspect_request(self, request) -> bool:
         method = (request.method or "").upper()
@@ -547,7 +682,7 @@ class APIKeyMiddleware:
         self.ip_rate = int(getattr(settings, "API_RATE_LIMIT_PER_IP_PER_MIN", 300))
 
     def __call__(self, request):
-        if not self._is_api_request(request.path):
+        if not self._is_api_request(request.path_info):
             return self.get_response(request)
 
         request.api_client = None  # type: ignore[attr-defined]
@@ -601,8 +736,7 @@ class APIKeyMiddleware:
         return response
 
     def _is_api_request(self, path: str | None) -> bool:
-        target = path or ""
-        return any(target.startswith(prefix) for prefix in self.protected_prefixes)
+        return (path or "").startswith(self.protected_prefixes)
 
     def _extract_key(self, request) -> str | None:
         header_value = request.META.get(self._header_meta_name, "").strip()
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_userprofile_acceptance_fields'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='skinfactview',
+            index=models.Index(fields=['user', 'topic', 'viewed_at'], name='core_skinfa_user_id_19b2b4_idx'),
+        ),
+    ]
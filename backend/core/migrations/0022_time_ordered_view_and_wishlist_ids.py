@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:38
+
+import core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_skinfactview_user_topic_viewed_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='skinfactview',
+            name='id',
+            field=models.UUIDField(default=core.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='wishlistitem',
+            name='id',
+            field=models.UUIDField(default=core.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
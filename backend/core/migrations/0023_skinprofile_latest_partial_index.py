@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_time_ordered_view_and_wishlist_ids'),
+        ('quiz', '0020_alter_matchpick_product_url_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='skinprofile',
+            name='core_skinpr_user_id_1558a9_idx',
+        ),
+        migrations.AlterField(
+            model_name='skinprofile',
+            name='is_latest',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddIndex(
+            model_name='skinprofile',
+            index=models.Index(condition=models.Q(('is_latest', True)), fields=['user'], name='sp_user_latest_partial'),
+        ),
+    ]
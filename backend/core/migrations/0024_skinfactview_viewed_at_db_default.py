@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:41
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_skinprofile_latest_partial_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='skinfactview',
+            name='viewed_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), db_index=True),
+        ),
+    ]
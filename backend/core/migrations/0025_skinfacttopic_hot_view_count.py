@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_skinfactview_viewed_at_db_default'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='skinfacttopic',
+            name='core_skinfa_view_co_6b927a_idx',
+        ),
+        migrations.AlterField(
+            model_name='skinfacttopic',
+            name='view_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        # Leave free space on each page so view_count increments stay HOT (same-page) updates.
+        migrations.RunSQL(
+            "ALTER TABLE core_skinfacttopic SET (fillfactor = 90);",
+            reverse_sql="ALTER TABLE core_skinfacttopic RESET (fillfactor);",
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:45
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def normalise_subscriber_emails(apps, schema_editor):
+    """
+    Lower-case existing addresses so the CHECK constraint can be added. When
+    several rows collapse to the same address, keep the earliest opt-in.
+    """
+    NewsletterSubscriber = apps.get_model("core", "NewsletterSubscriber")
+    subscribers = NewsletterSubscriber.objects.using(schema_editor.connection.alias)
+
+    keep = {}
+    duplicates = []
+    rows = subscribers.order_by("subscribed_at", "pk").values_list("pk", "email")
+    for pk, email in rows.iterator():
+        normalised = email.strip().lower()
+        if normalised in keep:
+            duplicates.append(pk)
+        else:
+            keep[normalised] = (pk, email)
+
+    if duplicates:
+        subscribers.filter(pk__in=duplicates).delete()
+    for normalised, (pk, email) in keep.items():
+        if email != normalised:
+            subscribers.filter(pk=pk).update(email=normalised)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_skinfacttopic_hot_view_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalise_subscriber_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='newslettersubscriber',
+            constraint=models.CheckConstraint(condition=models.Q(('email', django.db.models.functions.text.Lower('email'))), name='newsletter_email_lowercase'),
+        ),
+    ]
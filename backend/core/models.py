@@ -1,3 +1,5 @@
+import os
+import time
 import uuid
 import hashlib
 import hmac
@@ -9,9 +11,23 @@ from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator, validate_email
 from django.db import models
 from django.db.models import F, Q
+from django.db.models.functions import Lower, Now
 from django.utils import timezone
 from .validators import validate_fact_image_size, validate_image_mime_type
 
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48-bit Unix milliseconds followed by
+    random bits. Used as the primary key default on insert-heavy tables so new rows
+    land on the right-most B-tree page instead of a random one.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 # Create your models here.
 class UserProfile(models.Model):
     """
@@ -103,6 +119,14 @@ class UserProfile(models.Model):
         return current in {r.lower() for r in roles}
     
 
+class SkinProfileManager(models.Manager):
+    SNAPSHOT_FIELDS = ("answer_snapshot", "result_summary")
+
+    def without_snapshots(self):
+        """Profiles without the multi-KB quiz snapshot JSON, for concern/header lookups."""
+        return self.get_queryset().defer(*self.SNAPSHOT_FIELDS)
+
+
 class SkinProfile(models.Model):
     """Stores an immutable snapshot of a quiz result for a user."""
 
@@ -161,16 +185,19 @@ class SkinProfile(models.Model):
     answer_snapshot = models.JSONField(default=dict, blank=True)
     result_summary = models.JSONField(default=dict, blank=True)
     score_version = models.CharField(max_length=20, default="v1")
-    is_latest = models.BooleanField(default=True, db_index=True)
+    is_latest = models.BooleanField(default=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SkinProfileManager()
+
     class Meta:
         ordering = ("-created_at",)
         indexes = [
             models.Index(fields=["user", "created_at"]),
-            models.Index(fields=["user", "is_latest"]),
+            # Only the current profile per user is ever looked up by is_latest.
+            models.Index(fields=["user"], name="sp_user_latest_partial", condition=Q(is_latest=True)),
         ]
 
     def __str__(self):
@@ -206,7 +233,9 @@ class SkinFactTopic(models.Model):
     )
     hero_image_alt = models.CharField(max_length=160, blank=True)
     is_published = models.BooleanField(default=True, db_index=True)
-    view_count = models.PositiveIntegerField(default=0, db_index=True)
+    # Deliberately unindexed: increments then only touch non-indexed columns, so
+    # PostgreSQL can apply them as HOT updates instead of leaving index bloat behind.
+    view_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     last_updated = models.DateField(
@@ -219,7 +248,6 @@ class SkinFactTopic(models.Model):
         ordering = ("-created_at",)
         indexes = [
             models.Index(fields=["section", "is_published"]),
-            models.Index(fields=["view_count"]),
         ]
 
     def __str__(self) -> str:
@@ -312,7 +340,7 @@ class SkinFactContentBlock(models.Model):
 class SkinFactView(models.Model):
     """Tracks which topics a user has opened to power personalised popular topics."""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     topic = models.ForeignKey(
         SkinFactTopic, on_delete=models.CASCADE, related_name="views"
     )
@@ -326,12 +354,14 @@ class SkinFactView(models.Model):
     anonymous_key = models.CharField(
         max_length=64, blank=True, help_text="Best-effort identifier for anonymous sessions."
     )
-    viewed_at = models.DateTimeField(default=timezone.now, db_index=True)
+    viewed_at = models.DateTimeField(db_default=Now(), db_index=True)
 
     class Meta:
         indexes = [
             models.Index(fields=["user", "viewed_at"]),
             models.Index(fields=["topic", "viewed_at"]),
+            # Covers the per-user "most viewed topics" aggregation (group by topic, max viewed_at).
+            models.Index(fields=["user", "topic", "viewed_at"]),
         ]
 
     def save(self, *args, **kwargs):
@@ -357,6 +387,13 @@ class NewsletterSubscriber(models.Model):
 
     class Meta:
         ordering = ("-subscribed_at",)
+        constraints = [
+            # Addresses are stored lower-cased, which makes the plain unique index on
+            # email case-insensitive without a second LOWER(email) index.
+            models.CheckConstraint(
+                condition=Q(email=Lower("email")), name="newsletter_email_lowercase"
+            ),
+        ]
         indexes = [
             models.Index(fields=["subscribed_at"]),
         ]
@@ -370,15 +407,24 @@ class NewsletterSubscriber(models.Model):
             validate_email(normalised)
             self.email = normalised
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored (already normalised and validated) address.
+        instance._loaded_email = instance.__dict__.get("email")
+        return instance
+
     def save(self, *args: Any, **kwargs: Any) -> None:
-        self.clean()
+        if self._state.adding or self.email != getattr(self, "_loaded_email", None):
+            self.clean()
         super().save(*args, **kwargs)
+        self._loaded_email = self.email
 
 
 class WishlistItem(models.Model):
     """User wishlist entry for a quiz.Product."""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -406,6 +452,15 @@ class WishlistItem(models.Model):
     def __str__(self) -> str:
         return f"{self.user} - {getattr(self.product, 'name', 'product')}"
 
+    @classmethod
+    def bulk_add(cls, user, product_ids, *, batch_size: int = 500) -> None:
+        """
+        Save many products for one user in a single INSERT ... ON CONFLICT DO NOTHING;
+        products already on the wishlist are skipped by uniq_user_product_wishlist.
+        """
+        items = [cls(user=user, product_id=product_id) for product_id in dict.fromkeys(product_ids)]
+        cls.objects.bulk_create(items, ignore_conflicts=True, batch_size=batch_size)
+
 
 class APIClient(models.Model):
     """
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from typing import Any
 import html
+import threading
 
-import bleach
+from bleach.sanitizer import Cleaner
 
 ALLOWED_INLINE_TAGS = [
     "b",
@@ -26,27 +27,52 @@ ALLOWED_ATTRS = {
 ALLOWED_PROTOCOLS = ["http", "https", "mailto"]
 
 
+_cleaners = threading.local()
+
+
+def _get_cleaner(kind: str) -> Cleaner:
+    """
+    Return this thread's Cleaner for ``kind`` ("plain" or "markup").
+
+    Building a Cleaner sets up the html5lib parser/serializer, so instances are
+    reused; they are kept per thread because a Cleaner is not thread-safe.
+    """
+    cleaner = getattr(_cleaners, kind, None)
+    if cleaner is None:
+        if kind == "plain":
+            cleaner = Cleaner(tags=[], attributes={}, protocols=[], strip=True)
+        else:
+            cleaner = Cleaner(
+                tags=ALLOWED_INLINE_TAGS,
+                attributes=ALLOWED_ATTRS,
+                protocols=ALLOWED_PROTOCOLS,
+                strip=True,
+            )
+        setattr(_cleaners, kind, cleaner)
+    return cleaner
+
+
 def sanitize_plain_text(value: str | None) -> str:
     """Strip any HTML/JS from free-form text."""
-    cleaned = bleach.clean(
-        value or "",
-        tags=[],
-        attributes={},
-        strip=True,
-    )
-    return html.unescape(cleaned).strip()
+    if not value:
+        return ""
+    # Without "<" there can be no tag and without "&" no entity to decode. Bleach
+    # also drops NUL, folds "\r" into "\n" and replaces other control characters,
+    # so only printable text (plus newlines and tabs) can skip it unchanged.
+    if (
+        "<" not in value
+        and "&" not in value
+        and value.replace("\n", "").replace("\t", "").isprintable()
+    ):
+        return value.strip()
+    return html.unescape(_get_cleaner("plain").clean(value)).strip()
 
 
 def sanitize_basic_markup(value: str | None) -> str:
     """Allow only a constrained set of inline tags."""
-    cleaned = bleach.clean(
-        value or "",
-        tags=ALLOWED_INLINE_TAGS,
-        attributes=ALLOWED_ATTRS,
-        protocols=ALLOWED_PROTOCOLS,
-        strip=True,
-    )
-    return html.unescape(cleaned).strip()
+    if not value or value.isspace():
+        return ""
+    return html.unescape(_get_cleaner("markup").clean(value)).strip()
 
 
 def sanitize_metadata_dict(metadata: Any) -> dict[str, str]:
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+import threading
 from typing import Any
 
 from django.conf import settings
@@ -16,10 +19,14 @@ _LEVELS = {
     "error": logging.ERROR,
     "critical": logging.CRITICAL,
 }
+# Accept the upper-case spellings too, and keep the upper-case label for each known
+# severity, so the per-event path is dict lookups rather than lower()/upper() calls.
+_LEVELS.update({name.upper(): level for name, level in list(_LEVELS.items())})
+_SEVERITY_LABELS = {name: name.upper() for name in _LEVELS}
 
 
-def _resolve_level(severity: str) -> int:
-    return _LEVELS.get(severity.lower(), logging.INFO)
+_ALERT_QUEUE: queue.Queue | None = None
+_ALERT_QUEUE_LOCK = threading.Lock()
 
 
 def record_security_event(
@@ -33,33 +40,94 @@ def record_security_event(
     """
     Emit a structured log for SOC/SIEM ingestion and optionally trigger alerts.
     """
+    level = _LEVELS.get(severity)
+    if level is None:
+        level = _LEVELS.get(severity.lower(), logging.INFO)
+    recipients = getattr(settings, "SECURITY_ALERT_EMAILS", None)
+    logging_enabled = LOGGER.isEnabledFor(level)
+    if not logging_enabled and not recipients:
+        # Nothing would record or send this event (e.g. info events with the
+        # security logger at WARNING and alerting off); skip building the record.
+        return
     metadata = metadata or {}
-    level = _resolve_level(severity)
-    LOGGER.log(level, message, extra={"event_type": event_type, "severity": severity.upper(), "metadata": metadata})
-    _maybe_alert(event_type, severity, message, metadata, level, force_alert=force_alert)
+    label = _SEVERITY_LABELS.get(severity) or severity.upper()
+    if logging_enabled:
+        LOGGER.log(level, message, extra={"event_type": event_type, "severity": label, "metadata": metadata})
+    if recipients:
+        _maybe_alert(event_type, label, message, metadata, level, recipients, force_alert=force_alert)
 
 
 def _maybe_alert(
     event_type: str,
-    severity: str,
+    label: str,
     message: str,
     metadata: dict[str, Any],
     level: int,
+    recipients: list[str],
     *,
     force_alert: bool = False,
 ) -> None:
-    recipients = getattr(settings, "SECURITY_ALERT_EMAILS", [])
-    if not recipients:
-        return
     threshold_name = getattr(settings, "SECURITY_ALERT_MIN_LEVEL", "ERROR").lower()
     threshold = _LEVELS.get(threshold_name, logging.ERROR)
     if not force_alert and level < threshold:
         return
-    subject = f"[Security] {event_type} ({severity.upper()})"
+    subject = f"[Security] {event_type} ({label})"
     lines = [message, ""]
     if metadata:
         lines.append("Metadata:")
         for key, value in metadata.items():
             lines.append(f"- {key}: {value}")
     body = "\n".join(lines)
+    if not getattr(settings, "SECURITY_ALERT_ASYNC", True):
+        _send_alert(subject, body, tuple(recipients))
+        return
+    try:
+        _alert_queue().put_nowait((subject, body, tuple(recipients)))
+    except queue.Full:
+        LOGGER.warning("Security alert queue is full; dropping alert %s", subject)
+
+
+def _send_alert(subject: str, body: str, recipients: tuple[str, ...]) -> None:
     send_mail(subject, body, getattr(settings, "DEFAULT_FROM_EMAIL", None), recipients, fail_silently=True)
+
+
+def _alert_queue() -> queue.Queue:
+    """
+    Alert emails go through SMTP, so they are handed to a daemon worker instead
+    of blocking the request that observed the event.
+    """
+    global _ALERT_QUEUE
+    if _ALERT_QUEUE is not None:
+        return _ALERT_QUEUE
+    with _ALERT_QUEUE_LOCK:
+        if _ALERT_QUEUE is None:
+            alert_queue: queue.Queue = queue.Queue(maxsize=int(getattr(settings, "SECURITY_ALERT_QUEUE_SIZE", 1000)))
+            threading.Thread(target=_alert_worker, args=(alert_queue,), name="security-alerts", daemon=True).start()
+            atexit.register(_drain_alerts, alert_queue)
+            _ALERT_QUEUE = alert_queue
+    return _ALERT_QUEUE
+
+
+def _alert_worker(alert_queue: queue.Queue) -> None:
+    while True:
+        item = alert_queue.get()
+        try:
+            _send_alert(*item)
+        except Exception:  # pragma: no cover - keep the worker alive
+            LOGGER.exception("Failed to send security alert")
+        finally:
+            alert_queue.task_done()
+
+
+def _drain_alerts(alert_queue: queue.Queue) -> None:
+    while True:
+        try:
+            item = alert_queue.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            _send_alert(*item)
+        except Exception:  # pragma: no cover - best effort on shutdown
+            LOGGER.exception("Failed to send security alert")
+        finally:
+            alert_queue.task_done()
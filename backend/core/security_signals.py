@@ -3,7 +3,9 @@ from __future__ import annotations
 import logging
 from django.conf import settings
 from django.contrib.admin.models import LogEntry
+from django.contrib.auth import get_user_model
 from django.contrib.auth.signals import user_logged_in, user_login_failed
+from django.core.cache import cache
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -62,18 +64,39 @@ def capture_login_success(sender, user, request, **kwargs):
     )
 
 
+ADMIN_USERNAME_CACHE_SECONDS = 300
+
+
+def _admin_username(user_id) -> str | None:
+    """Username for an admin LogEntry, cached so a burst of admin actions looks it up once."""
+    if user_id is None:
+        return None
+    cache_key = f"security:admin_username:{user_id}"
+    username = cache.get(cache_key)
+    if username is None:
+        User = get_user_model()
+        username = (
+            User.objects.filter(pk=user_id).values_list(User.USERNAME_FIELD, flat=True).first()
+        )
+        if username is not None:
+            cache.set(cache_key, username, ADMIN_USERNAME_CACHE_SECONDS)
+    return username
+
+
 @receiver(post_save, sender=LogEntry)
 def capture_admin_change(sender, instance: LogEntry, created: bool, **kwargs):
     if not created:
         return
-    try:
-        username = instance.user.get_username()
-    except Exception:  # pragma: no cover - user deleted
-        username = None
+    # Automation/service accounts can be excluded from the admin audit events.
+    skip_ids = getattr(settings, "SECURITY_ADMIN_LOG_SKIP_USER_IDS", ())
+    if skip_ids and (instance.user_id in skip_ids or str(instance.user_id) in skip_ids):
+        return
+    username = _admin_username(instance.user_id)
+    change_message = instance.get_change_message()
     metadata = {
         "user_id": instance.user_id,
         "user": username,
-        "action_flag": instance.get_change_message(),
+        "action_flag": change_message,
         "object_repr": instance.object_repr,
         "content_type_id": instance.content_type_id,
         "object_id": instance.object_id,
@@ -82,6 +105,6 @@ def capture_admin_change(sender, instance: LogEntry, created: bool, **kwargs):
     record_security_event(
         "admin.action",
         "info",
-        f"Admin action by {metadata['user'] or metadata['user_id']}: {instance.get_change_message()}",
+        f"Admin action by {metadata['user'] or metadata['user_id']}: {change_message}",
         metadata=metadata,
     )
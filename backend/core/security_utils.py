@@ -1,14 +1,40 @@
 from __future__ import annotations
 
 import ipaddress
-from typing import Iterable
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Iterable, NamedTuple
 
 from django.conf import settings
 from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+_UNSET = object()
+_CLIENT_IP_ATTR = "_skinmatch_client_ip"
+
+
+@lru_cache(maxsize=1)
+def _default_ip_headers() -> tuple[str, ...]:
+    return tuple(getattr(settings, "ADMIN_TRUSTED_IP_HEADERS", ["HTTP_X_FORWARDED_FOR", "REMOTE_ADDR"]))
+
+
+@receiver(setting_changed)
+def _reset_default_ip_headers(*, setting, **kwargs):
+    if setting == "ADMIN_TRUSTED_IP_HEADERS":
+        _default_ip_headers.cache_clear()
 
 
 def get_client_ip(request, header_order: Iterable[str] | None = None) -> str | None:
-    headers = list(header_order or getattr(settings, "ADMIN_TRUSTED_IP_HEADERS", ["HTTP_X_FORWARDED_FOR", "REMOTE_ADDR"]))
+    if header_order is None:
+        # Several middlewares and signal handlers ask for the IP of the same request;
+        # resolve the default header chain once and keep it on the request.
+        cached = getattr(request, _CLIENT_IP_ATTR, _UNSET)
+        if cached is not _UNSET:
+            return cached
+    headers = header_order or _default_ip_headers()
+    client_ip = None
     for header in headers:
         raw_value = request.META.get(header)
         if not raw_value:
@@ -18,26 +44,92 @@ def get_client_ip(request, header_order: Iterable[str] | None = None) -> str | N
         else:
             candidate = raw_value.strip()
         if candidate:
-            return candidate
-    return None
+            client_ip = candidate
+            break
+    if header_order is None:
+        setattr(request, _CLIENT_IP_ATTR, client_ip)
+    return client_ip
 
 
 def bump_counter(key: str, window_seconds: int) -> int:
     """
     Increment a cache-based counter that automatically expires after window_seconds.
+
+    incr() is tried first because during a burst the key almost always exists,
+    making the common case a single atomic cache call. Only a missing key falls
+    back to add(), which starts the window without resetting an existing TTL.
     """
-    added = cache.add(key, 1, window_seconds)
-    if added:
-        return 1
-    try:
-        return cache.incr(key)
-    except Exception:  # pragma: no cover - cache backend without incr
-        current = cache.get(key, 0) + 1
-        cache.set(key, current, window_seconds)
-        return current
+    for _ in range(2):
+        try:
+            return cache.incr(key)
+        except ValueError:
+            # Missing or expired key. If add() loses a race with another
+            # process creating it, loop once more and increment theirs.
+            if cache.add(key, 1, window_seconds):
+                return 1
+        except Exception:  # pragma: no cover - cache backend without incr
+            break
+    current = cache.get(key, 0) + 1
+    cache.set(key, current, window_seconds)
+    return current
+
+
+class AddressRanges(NamedTuple):
+    """Sorted, non-overlapping half-open [start, end) integer address ranges."""
+
+    starts: tuple[int, ...]
+    ends: tuple[int, ...]
+
+    def contains(self, ip_int: int) -> bool:
+        index = bisect_right(self.starts, ip_int) - 1
+        return index >= 0 and ip_int < self.ends[index]
+
+
+class ParsedNetworks(NamedTuple):
+    """
+    An IP allowlist split by version into merged integer ranges. Containment only
+    looks at the matching version and is a binary search, so large allowlists
+    cost O(log N) per check instead of an ipaddress.__contains__ call per entry.
+    """
+
+    v4: AddressRanges
+    v6: AddressRanges
+
+    @classmethod
+    def from_networks(cls, networks: Iterable[ipaddress._BaseNetwork]) -> "ParsedNetworks":
+        buckets: dict[int, list[tuple[int, int]]] = {4: [], 6: []}
+        for network in networks:
+            start = int(network.network_address)
+            buckets[network.version].append((start, start + network.num_addresses))
+        return cls(v4=_merge_ranges(buckets[4]), v6=_merge_ranges(buckets[6]))
+
+    def contains(self, ip_obj: ipaddress._BaseAddress) -> bool:
+        ranges = self.v4 if ip_obj.version == 4 else self.v6
+        return ranges.contains(int(ip_obj))
+
+
+def _merge_ranges(ranges: list[tuple[int, int]]) -> AddressRanges:
+    starts: list[int] = []
+    ends: list[int] = []
+    for start, end in sorted(ranges):
+        if ends and start <= ends[-1]:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return AddressRanges(tuple(starts), tuple(ends))
+
+
+def parse_ip_networks(entries: Iterable[str]) -> ParsedNetworks:
+    """
+    Parse IP/CIDR allowlist entries, skipping invalid ones. Results are cached per
+    distinct entry list, since the same API client allowlists are checked on every call.
+    """
+    return _parse_ip_networks(tuple(entries))
 
 
-def parse_ip_networks(entries: Iterable[str]) -> list[ipaddress._BaseNetwork]:
+@lru_cache(maxsize=64)
+def _parse_ip_networks(entries: tuple[str, ...]) -> ParsedNetworks:
     networks: list[ipaddress._BaseNetwork] = []
     for raw in entries:
         value = (raw or "").strip()
@@ -48,22 +140,23 @@ def parse_ip_networks(entries: Iterable[str]) -> list[ipaddress._BaseNetwork]:
                 network = ipaddress.ip_network(value, strict=False)
             else:
                 ip_obj = ipaddress.ip_address(value)
-                mask = 32 if ip_obj.version == 4 else 128
-                network = ipaddress.ip_network(f"{ip_obj}/{mask}", strict=False)
+                network = ipaddress.ip_network((ip_obj, ip_obj.max_prefixlen))
             networks.append(network)
         except ValueError:
             continue
-    return networks
+    return ParsedNetworks.from_networks(networks)
 
 
-def ip_in_networks(ip: str | ipaddress._BaseAddress | None, networks: Iterable[ipaddress._BaseNetwork]) -> bool:
+def ip_in_networks(
+    ip: str | ipaddress._BaseAddress | None,
+    networks: ParsedNetworks | Iterable[ipaddress._BaseNetwork],
+) -> bool:
     if not ip:
         return False
     try:
         ip_obj = ipaddress.ip_address(ip) if not isinstance(ip, ipaddress._BaseAddress) else ip
     except ValueError:
         return False
-    for network in networks:
-        if ip_obj in network:
-            return True
-    return False
+    if not isinstance(networks, ParsedNetworks):
+        networks = ParsedNetworks.from_networks(networks)
+    return networks.contains(ip_obj)
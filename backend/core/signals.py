@@ -1,12 +1,14 @@
 # core/signals.py
 import logging
 import os
+import threading
+from itertools import chain
 from urllib.parse import quote
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
-from django.db import DatabaseError
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import DatabaseError, connections, transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
@@ -15,10 +17,20 @@ from core.models import UserProfile, SkinFactTopic, NewsletterSubscriber
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+RECIPIENT_CHUNK_SIZE = 1000
+_UNSUBSCRIBE_PLACEHOLDER = "\x00unsubscribe-url\x00"
+
 @receiver(post_save, sender=User)
-def ensure_profile(sender, instance, created, **kwargs):
-    if created:
+def ensure_profile(sender, instance, created, raw=False, **kwargs):
+    if not created:
+        return
+    if raw:
+        # Fixture loads may ship the profile row themselves.
         UserProfile.objects.get_or_create(user=instance)
+    else:
+        # A user that was just inserted cannot have a profile yet, so skip
+        # get_or_create's SELECT and savepoint and insert directly.
+        UserProfile.objects.create(user=instance)
 
 
 def _get_site_base_url() -> str:
@@ -118,16 +130,45 @@ def _build_topic_html_message(
 def notify_new_skin_fact_topic(sender, instance: SkinFactTopic, created: bool, **kwargs):
     if not created or not instance.is_published:
         return
+    # Mail only once the topic is committed: a rolled-back save never reaches
+    # subscribers and the SMTP fan-out doesn't hold the admin's transaction open.
+    transaction.on_commit(lambda: _dispatch_topic_announcement(instance))
 
+
+def _dispatch_topic_announcement(instance: SkinFactTopic) -> None:
+    if not getattr(settings, "NEWSLETTER_ANNOUNCE_ASYNC", True):
+        _send_topic_announcement(instance)
+        return
+    # Hand the fan-out to its own thread so the admin response doesn't wait on
+    # SMTP. Not a daemon thread, so a graceful shutdown lets the send finish.
+    threading.Thread(
+        target=_announce_in_background,
+        args=(instance,),
+        name="skinfact-announcement",
+    ).start()
+
+
+def _announce_in_background(instance: SkinFactTopic) -> None:
     try:
-        recipients = list(
-            NewsletterSubscriber.objects.values_list("email", flat=True)
-        )
+        _send_topic_announcement(instance)
+    finally:
+        connections.close_all()
+
+
+def _send_topic_announcement(instance: SkinFactTopic) -> None:
+    # Stream addresses in chunks rather than loading the whole list up front.
+    recipients = (
+        NewsletterSubscriber.objects.exclude(email="")
+        .values_list("email", flat=True)
+        .iterator(chunk_size=RECIPIENT_CHUNK_SIZE)
+    )
+    try:
+        first_email = next(recipients, None)
     except DatabaseError as exc:
         logger.warning("Unable to load newsletter subscribers for topic email: %s", exc)
         return
 
-    if not recipients:
+    if first_email is None:
         return
 
     base_url = _get_site_base_url()
@@ -142,25 +183,35 @@ def notify_new_skin_fact_topic(sender, instance: SkinFactTopic, created: bool, *
     sender_email = getattr(settings, "DEFAULT_FROM_EMAIL", None) or "no-reply@skinmatch.local"
     subject = f"New Skin Fact: {instance.title}"
 
-    for email in recipients:
-        unsubscribe_url = f"{base_url}/newsletter/unsubscribe"
-        if email:
-            unsubscribe_url += f"?email={quote(email)}"
-        plain_message = _build_topic_plain_message(instance, topic_url, unsubscribe_url)
-        html_message = _build_topic_html_message(
-            instance,
-            topic_url,
-            hero_url,
-            unsubscribe_url,
-        )
-        try:
-            send_mail(
-                subject=subject,
-                message=plain_message,
-                from_email=sender_email,
-                recipient_list=[email],
-                html_message=html_message,
-                fail_silently=False,
-            )
-        except Exception as exc:
-            logger.warning("Unable to send Skin Fact announcement to %s: %s", email, exc)
+    # Only the unsubscribe link differs per recipient, so render both bodies once
+    # around a placeholder and substitute the link in the loop.
+    plain_template = _build_topic_plain_message(instance, topic_url, _UNSUBSCRIBE_PLACEHOLDER)
+    html_template = _build_topic_html_message(
+        instance,
+        topic_url,
+        hero_url,
+        _UNSUBSCRIBE_PLACEHOLDER,
+    )
+    unsubscribe_base = f"{base_url}/newsletter/unsubscribe"
+
+    try:
+        # One SMTP session for the whole fan-out instead of a connect/login per subscriber.
+        with get_connection() as connection:
+            for email in chain([first_email], recipients):
+                unsubscribe_url = f"{unsubscribe_base}?email={quote(email)}"
+                plain_message = plain_template.replace(_UNSUBSCRIBE_PLACEHOLDER, unsubscribe_url)
+                html_message = html_template.replace(_UNSUBSCRIBE_PLACEHOLDER, unsubscribe_url)
+                message = EmailMultiAlternatives(
+                    subject=subject,
+                    body=plain_message,
+                    from_email=sender_email,
+                    to=[email],
+                    connection=connection,
+                )
+                message.attach_alternative(html_message, "text/html")
+                try:
+                    message.send()
+                except Exception as exc:
+                    logger.warning("Unable to send Skin Fact announcement to %s: %s", email, exc)
+    except Exception as exc:
+        logger.warning("Skin Fact announcement for %s stopped early: %s", instance.slug, exc)
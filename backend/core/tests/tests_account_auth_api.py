@@ -14,6 +14,20 @@ class AccountAuthAPITests(TestCase):
     signup_url = "/api/auth/signup"
     token_url = "/api/auth/token"
     me_url = "/api/auth/me"
+    password = "Sup3r!Secure"
+
+    @classmethod
+    def setUpTestData(cls):
+        # One account covers the duplicate, login and "taken" checks; each extra
+        # create_user would pay another password hash.
+        cls.existing = User.objects.create_user(
+            username="GlowUser",
+            email="Existing@example.com",
+            password=cls.password,
+            first_name="Profile",
+            last_name="User",
+        )
+        cls.bearer = f"Bearer {create_access_token(cls.existing)}"
 
     def _signup_payload(self, **overrides):
         base = {
@@ -52,14 +66,6 @@ class AccountAuthAPITests(TestCase):
         self.assertEqual(profile.date_of_birth.isoformat(), payload["date_of_birth"])
 
     def test_signup_rejects_duplicate_emails_case_insensitively(self):
-        existing = User.objects.create_user(
-            username="existing",
-            email="existing@example.com",
-            password="DummyPass123!",
-        )
-        existing.email = "Existing@example.com"
-        existing.save(update_fields=["email"])
-
         payload = self._signup_payload(
             username="another",
             email="existing@example.com".upper(),
@@ -76,14 +82,6 @@ class AccountAuthAPITests(TestCase):
         self.assertIn("Email already in use", data["message"])
 
     def test_signup_rejects_duplicate_username_case_insensitively(self):
-        existing = User.objects.create_user(
-            username="GlowUser",
-            email="unique@example.com",
-            password="DummyPass123!",
-        )
-        existing.username = "GlowUser"
-        existing.save(update_fields=["username"])
-
         payload = self._signup_payload(username="glowuser", email="another@example.com")
         response = self.client.post(
             self.signup_url,
@@ -97,16 +95,10 @@ class AccountAuthAPITests(TestCase):
         self.assertIn("Username already taken", data["message"])
 
     def test_token_login_with_email_returns_jwt(self):
-        password = "Sup3r!Secure"
-        user = User.objects.create_user(
-            username="tokenuser",
-            email="token@example.com",
-            password=password,
-        )
-
+        user = self.existing
         response = self.client.post(
             self.token_url,
-            data=json.dumps({"identifier": user.email, "password": password}),
+            data=json.dumps({"identifier": user.email, "password": self.password}),
             content_type="application/json",
         )
 
@@ -120,15 +112,9 @@ class AccountAuthAPITests(TestCase):
         self.assertEqual(decoded["user_id"], user.id)
 
     def test_token_login_rejects_wrong_password(self):
-        user = User.objects.create_user(
-            username="wrongpass",
-            email="wrongpass@example.com",
-            password="CorrectPass123!",
-        )
-
         response = self.client.post(
             self.token_url,
-            data=json.dumps({"identifier": user.username, "password": "badpass"}),
+            data=json.dumps({"identifier": self.existing.username, "password": "badpass"}),
             content_type="application/json",
         )
 
@@ -138,19 +124,8 @@ class AccountAuthAPITests(TestCase):
         self.assertIn("incorrect", data["message"].lower())
 
     def test_me_endpoint_requires_valid_bearer_token(self):
-        user = User.objects.create_user(
-            username="profileuser",
-            email="profile@example.com",
-            password="StrongPass!234",
-            first_name="Profile",
-            last_name="User",
-        )
-
-        token = create_access_token(user)
-        response = self.client.get(
-            self.me_url,
-            HTTP_AUTHORIZATION=f"Bearer {token}",
-        )
+        user = self.existing
+        response = self.client.get(self.me_url, HTTP_AUTHORIZATION=self.bearer)
 
         self.assertEqual(response.status_code, 200)
         data = response.json()
@@ -174,15 +149,9 @@ class AccountAuthAPITests(TestCase):
 
     def test_check_username_taken(self):
         """Test that taken usernames return available=False"""
-        User.objects.create_user(
-            username="takenuser",
-            email="taken@example.com",
-            password="Pass123!",
-        )
-        
         response = self.client.post(
             "/api/auth/check-username",
-            data=json.dumps({"username": "takenuser"}),
+            data=json.dumps({"username": "GlowUser"}),
             content_type="application/json",
         )
         
@@ -193,15 +162,9 @@ class AccountAuthAPITests(TestCase):
 
     def test_check_username_case_insensitive(self):
         """Test that username check is case-insensitive"""
-        User.objects.create_user(
-            username="CoolUser",
-            email="cool@example.com",
-            password="Pass123!",
-        )
-        
         response = self.client.post(
             "/api/auth/check-username",
-            data=json.dumps({"username": "cooluser"}),
+            data=json.dumps({"username": "glowuser"}),
             content_type="application/json",
         )
         
@@ -1,10 +1,12 @@
 import pytest
 from decimal import Decimal
+from types import SimpleNamespace
 from uuid import uuid4
 
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 
+from core.api import list_wishlist
 from core.auth import create_access_token
 from core.models import WishlistItem
 from quiz.models import Product
@@ -13,13 +15,19 @@ from quiz.models import Product
 User = get_user_model()
 
 
-@pytest.fixture
-def user(db):
-    return User.objects.create_user(
-        username="wishlist-user",
-        email="wishlist@example.com",
-        password="StrongPass!234",
-    )
+@pytest.fixture(scope="module")
+def user(django_db_setup, django_db_blocker):
+    # Created once for the module, outside the per-test transactions; each test's
+    # own writes (products, wishlist rows) still roll back as usual.
+    with django_db_blocker.unblock():
+        account = User.objects.create_user(
+            username="wishlist-user",
+            email="wishlist@example.com",
+            password="StrongPass!234",
+        )
+    yield account
+    with django_db_blocker.unblock():
+        account.delete()
 
 
 @pytest.fixture
@@ -27,7 +35,7 @@ def api_client():
     return APIClient()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth_headers(user):
     token = create_access_token(user)
     return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
@@ -156,3 +164,25 @@ def test_wishlist_endpoints_require_auth(api_client, make_product):
         == 401
     )
     assert api_client.delete(f"/api/wishlist/{product.id}").status_code == 401
+
+
+@pytest.mark.django_db
+def test_list_serializes_without_lazy_product_loads(user, make_product, django_assert_num_queries):
+    for name in ("Bright Serum", "Calm Cream"):
+        WishlistItem.objects.create(user=user, product=make_product(name=name))
+
+    with django_assert_num_queries(1):
+        items = list_wishlist(SimpleNamespace(auth=user))
+
+    assert {item["name"] for item in items} == {"Bright Serum", "Calm Cream"}
+
+
+@pytest.mark.django_db
+def test_bulk_add_skips_duplicates_in_one_query(user, make_product, django_assert_num_queries):
+    saved, fresh = make_product(), make_product()
+    WishlistItem.objects.create(user=user, product=saved)
+
+    with django_assert_num_queries(1):
+        WishlistItem.bulk_add(user, [saved.id, fresh.id, fresh.id])
+
+    assert set(WishlistItem.objects.filter(user=user).values_list("product_id", flat=True)) == {saved.id, fresh.id}
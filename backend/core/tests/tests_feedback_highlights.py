@@ -11,24 +11,28 @@ from quiz.models import QuizFeedback, QuizSession
 class QuizFeedbackHighlightTests(TestCase):
     """Exercise the feedback highlight endpoint edge cases."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             username="highlight-user",
             email="highlight@example.com",
             password="changeme123",
             first_name="Highlight",
             last_name="Tester",
         )
-        self.session = QuizSession.objects.create(user=self.user)
+        cls.session = QuizSession.objects.create(user=cls.user)
 
     def test_highlights_respect_limit_cap(self):
-        for index in range(15):
-            QuizFeedback.objects.create(
+        QuizFeedback.objects.bulk_create(
+            QuizFeedback(
                 rating=4,
                 message=f"Helpful tips {index}",
                 metadata={"display_name": f"Member {index}"},
             )
+            for index in range(15)
+        )
 
         response = self.client.get("/api/quiz/feedback/highlights", {"limit": 20})
         self.assertEqual(response.status_code, 200)
@@ -57,33 +61,6 @@ class QuizFeedbackHighlightTests(TestCase):
         """Users with multiple submissions should only surface their best entry."""
 
         newer_session = QuizSession.objects.create(user=self.user)
-
-        older_lower = QuizFeedback.objects.create(
-            session=self.session,
-            rating=3,
-            message="It was ok.",
-            metadata={},
-        )
-        # ensure deterministic ordering by timestamp
-        older_lower.created_at = timezone.now() - timedelta(days=5)
-        older_lower.save(update_fields=["created_at"])
-
-        older_high = QuizFeedback.objects.create(
-            session=newer_session,
-            rating=5,
-            message="Loved it (first try)!",
-            metadata={},
-        )
-        older_high.created_at = timezone.now() - timedelta(days=2)
-        older_high.save(update_fields=["created_at"])
-
-        newest_high = QuizFeedback.objects.create(
-            session=self.session,
-            rating=5,
-            message="Loved it (newer)!",
-            metadata={},
-        )
-
         other_user = get_user_model().objects.create_user(
             username="feedback-two",
             email="two@example.com",
@@ -92,12 +69,23 @@ class QuizFeedbackHighlightTests(TestCase):
             last_name="Member",
         )
         other_session = QuizSession.objects.create(user=other_user)
-        QuizFeedback.objects.create(
-            session=other_session,
-            rating=4,
-            message="Second user feedback",
-            metadata={},
+
+        older_lower, older_high, _newest_high, _other = QuizFeedback.objects.bulk_create(
+            [
+                QuizFeedback(session=self.session, rating=3, message="It was ok.", metadata={}),
+                QuizFeedback(
+                    session=newer_session, rating=5, message="Loved it (first try)!", metadata={}
+                ),
+                QuizFeedback(session=self.session, rating=5, message="Loved it (newer)!", metadata={}),
+                QuizFeedback(
+                    session=other_session, rating=4, message="Second user feedback", metadata={}
+                ),
+            ]
         )
+        # ensure deterministic ordering by timestamp
+        now = timezone.now()
+        QuizFeedback.objects.filter(pk=older_lower.pk).update(created_at=now - timedelta(days=5))
+        QuizFeedback.objects.filter(pk=older_high.pk).update(created_at=now - timedelta(days=2))
 
         response = self.client.get("/api/quiz/feedback/highlights", {"limit": 5})
         self.assertEqual(response.status_code, 200)
@@ -8,8 +8,9 @@ from quiz.models import QuizFeedback, QuizSession
 class QuizFeedbackAPITests(TestCase):
     """Validate quiz feedback submission and highlight endpoints."""
 
+    client_class = APIClient
+
     def setUp(self):
-        self.client = APIClient()
         self.user = get_user_model().objects.create_user(
             username="feedback-user",
             email="feedback@example.com",
@@ -127,3 +128,14 @@ class QuizFeedbackAPITests(TestCase):
         self.assertEqual(entry["display_name"], "Glow Getter")
         self.assertEqual(entry["location"], "Bangkok")
         self.assertEqual(entry["badge"], "Dewy")
+
+    def test_feedback_strips_control_characters_before_saving(self):
+        record = QuizFeedback.objects.create(
+            session=self.session,
+            rating=4,
+            message="hello\x00world\r\nbye",
+            metadata={"location": "Bang\x00kok"},
+        )
+        record.refresh_from_db()
+        self.assertEqual(record.message, "helloworld\nbye")
+        self.assertEqual(record.metadata, {"location": "Bangkok"})
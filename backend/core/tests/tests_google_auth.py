@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from core.google_auth import authenticate_google_id_token
+from core.models import UserProfile
+
+User = get_user_model()
+
+
+def _idinfo(**overrides):
+    payload = {
+        "sub": "google-sub-1",
+        "email": "Grace@Example.com",
+        "email_verified": True,
+        "name": "Grace Hopper",
+        "given_name": "Grace",
+        "family_name": "Hopper",
+    }
+    payload.update(overrides)
+    return payload
+
+
+@override_settings(GOOGLE_OAUTH_CLIENT_IDS=["test-client"])
+class GoogleIdTokenAuthTests(TestCase):
+    def authenticate(self, idinfo):
+        with patch(
+            "core.google_auth.google_id_token.verify_oauth2_token",
+            return_value=idinfo,
+        ):
+            return authenticate_google_id_token("token")
+
+    def test_creates_user_and_links_profile(self):
+        user, created, message = self.authenticate(_idinfo())
+        self.assertTrue(created)
+        self.assertEqual(message, "Account created via Google")
+        self.assertEqual(user.email, "grace@example.com")
+        profile = UserProfile.objects.get(user=user)
+        self.assertEqual(profile.google_sub, "google-sub-1")
+        self.assertTrue(profile.is_verified)
+
+    def test_links_existing_account_by_email(self):
+        existing = User.objects.create_user(
+            username="grace", email="grace@example.com", password="x"
+        )
+        user, created, _ = self.authenticate(_idinfo())
+        self.assertFalse(created)
+        self.assertEqual(user.pk, existing.pk)
+        self.assertEqual(UserProfile.objects.get(user=existing).google_sub, "google-sub-1")
+
+    def test_google_subject_match_wins_over_email_match(self):
+        linked = User.objects.create_user(
+            username="linked", email="other@example.com", password="x"
+        )
+        UserProfile.objects.filter(user=linked).update(google_sub="google-sub-1")
+        User.objects.create_user(username="grace", email="grace@example.com", password="x")
+
+        user, created, message = self.authenticate(_idinfo())
+        self.assertFalse(created)
+        self.assertEqual(message, "Login successful")
+        self.assertEqual(user.pk, linked.pk)
+
+    def test_returning_user_login_skips_profile_write(self):
+        user, _, _ = self.authenticate(_idinfo())
+        profile = UserProfile.objects.get(user=user)
+        stamp = profile.updated_at
+
+        with self.assertNumQueries(3):  # savepoint, locked lookup, release
+            _, created, _ = self.authenticate(_idinfo())
+        self.assertFalse(created)
+        profile.refresh_from_db()
+        self.assertEqual(profile.updated_at, stamp)
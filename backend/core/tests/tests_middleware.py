@@ -0,0 +1,232 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.base import SessionBase
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from core.middleware import (
+    AdminAccessControlMiddleware,
+    CombinedSecurityMiddleware,
+    SecurityHeadersMiddleware,
+    SecurityMonitoringMiddleware,
+    SessionIdleTimeoutMiddleware,
+)
+
+
+def _ok(_request):
+    return HttpResponse("ok")
+
+
+class AnonymousRequestMixin:
+    def anonymous_get(self, path, **extra):
+        request = self.factory.get(path, **extra)
+        request.user = AnonymousUser()
+        return request
+
+
+@override_settings(
+    CONTENT_SECURITY_POLICY=" default-src 'self' ",
+    CONTENT_SECURITY_POLICY_REPORT_ONLY=False,
+    SECURE_REFERRER_POLICY="same-origin",
+    SECURE_CONTENT_TYPE_NOSNIFF=True,
+    X_FRAME_OPTIONS="DENY",
+    SECURE_HSTS_SECONDS=3600,
+    SECURE_HSTS_INCLUDE_SUBDOMAINS=True,
+    SECURE_HSTS_PRELOAD=True,
+)
+class SecurityHeadersMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_applies_configured_headers(self):
+        response = SecurityHeadersMiddleware(_ok)(self.factory.get("/healthz/"))
+        self.assertEqual(response["Content-Security-Policy"], "default-src 'self'")
+        self.assertEqual(response["Referrer-Policy"], "same-origin")
+        self.assertEqual(response["X-Content-Type-Options"], "nosniff")
+        self.assertEqual(response["X-Frame-Options"], "DENY")
+        self.assertEqual(
+            response["Strict-Transport-Security"],
+            "max-age=3600; includeSubDomains; preload",
+        )
+
+    def test_keeps_headers_set_by_the_view(self):
+        def view(_request):
+            response = HttpResponse("ok")
+            response["X-Frame-Options"] = "SAMEORIGIN"
+            return response
+
+        response = SecurityHeadersMiddleware(view)(self.factory.get("/healthz/"))
+        self.assertEqual(response["X-Frame-Options"], "SAMEORIGIN")
+
+    def test_docs_use_relaxed_policy(self):
+        response = SecurityHeadersMiddleware(_ok)(self.factory.get("/api/docs"))
+        self.assertEqual(response["Content-Security-Policy"], SecurityHeadersMiddleware.DOCS_CSP)
+
+    @override_settings(CONTENT_SECURITY_POLICY_REPORT_ONLY=True, SECURE_HSTS_SECONDS=0)
+    def test_report_only_and_disabled_hsts(self):
+        response = SecurityHeadersMiddleware(_ok)(self.factory.get("/healthz/"))
+        self.assertIn("Content-Security-Policy-Report-Only", response)
+        self.assertNotIn("Content-Security-Policy", response)
+        self.assertNotIn("Strict-Transport-Security", response)
+
+
+@override_settings(
+    SECURITY_SUSPICIOUS_PATH_KEYWORDS=["wp-admin", ".php"],
+    SECURITY_MONITOR_STATUS_CODES=[404],
+    SECURITY_MONITOR_RATE_THRESHOLD=2,
+)
+class SecurityMonitoringMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = SecurityMonitoringMiddleware(_ok)
+
+    def test_flags_suspicious_path_keywords(self):
+        with patch("core.middleware.record_security_event") as record:
+            self.middleware(self.factory.get("/blog/WP-Admin/setup.PHP"))
+        record.assert_called_once()
+        self.assertEqual(record.call_args.args[0], "traffic.suspicious_path")
+
+    def test_ignores_clean_paths(self):
+        with patch("core.middleware.record_security_event") as record:
+            self.middleware(self.factory.get("/api/v1/products"))
+        record.assert_not_called()
+
+    def test_skips_static_and_media_requests(self):
+        middleware = SecurityMonitoringMiddleware(lambda _request: HttpResponse(status=404))
+        with patch("core.middleware.bump_counter") as bump, patch(
+            "core.middleware.record_security_event"
+        ) as record:
+            middleware(self.factory.get("/static/wp-admin.php"))
+            middleware(self.factory.get("/media/missing.png"))
+        bump.assert_not_called()
+        record.assert_not_called()
+
+    def test_reports_repeated_error_statuses(self):
+        middleware = SecurityMonitoringMiddleware(lambda _request: HttpResponse(status=404))
+        with patch("core.middleware.bump_counter", side_effect=[1, 2]), patch(
+            "core.middleware.record_security_event"
+        ) as record:
+            middleware(self.factory.get("/missing"))
+            record.assert_not_called()
+            middleware(self.factory.get("/missing"))
+        record.assert_called_once()
+        self.assertEqual(record.call_args.args[0], "traffic.anomaly")
+
+
+@override_settings(SESSION_IDLE_TIMEOUT_SECONDS=600)
+class SessionIdleTimeoutMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = SessionIdleTimeoutMiddleware(_ok)
+
+    def make_request(self, last_activity=None):
+        request = self.factory.get("/api/v1/profile")
+        request.user = SimpleNamespace(is_authenticated=True, pk=1)
+        request.session = SessionBase()
+        if last_activity is not None:
+            request.session[SessionIdleTimeoutMiddleware.SESSION_KEY] = last_activity
+            request.session.modified = False
+        return request
+
+    @patch("core.middleware.time.time", return_value=1_000.0)
+    def test_first_request_records_activity(self, _time):
+        request = self.make_request()
+        self.middleware(request)
+        self.assertEqual(request.session[SessionIdleTimeoutMiddleware.SESSION_KEY], 1_000.0)
+
+    @patch("core.middleware.time.time", return_value=1_010.0)
+    def test_recent_activity_leaves_session_unmodified(self, _time):
+        request = self.make_request(last_activity=1_000.0)
+        self.middleware(request)
+        self.assertFalse(request.session.modified)
+        self.assertEqual(request.session[SessionIdleTimeoutMiddleware.SESSION_KEY], 1_000.0)
+
+    @patch("core.middleware.time.time", return_value=1_100.0)
+    def test_stale_activity_is_refreshed(self, _time):
+        request = self.make_request(last_activity=1_000.0)
+        self.middleware(request)
+        self.assertTrue(request.session.modified)
+        self.assertEqual(request.session[SessionIdleTimeoutMiddleware.SESSION_KEY], 1_100.0)
+
+    @patch("core.middleware.time.time", return_value=2_000.0)
+    def test_expired_api_session_returns_401(self, _time):
+        request = self.make_request(last_activity=1_000.0)
+        with patch("core.middleware.logout"), patch("core.middleware.record_security_event"):
+            response = self.middleware(request)
+        self.assertEqual(response.status_code, 401)
+
+
+@override_settings(ADMIN_ALLOWED_IPS=["10.0.0.0/8", "2001:db8::/32", "198.51.100.7"], ADMIN_ALLOWED_COUNTRIES=[], ADMIN_ALLOWED_ROLES=[])
+class AdminAccessControlMiddlewareTests(AnonymousRequestMixin, SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = AdminAccessControlMiddleware(_ok)
+
+    def test_allows_whitelisted_ip(self):
+        request = self.anonymous_get("/admin/", HTTP_X_FORWARDED_FOR="10.1.2.3, 192.168.0.1")
+        self.assertEqual(self.middleware(request).status_code, 200)
+
+    def test_skips_malformed_forwarded_entries(self):
+        request = self.anonymous_get(
+            "/admin/", HTTP_X_FORWARDED_FOR="unknown, 10.9.8.7", REMOTE_ADDR="203.0.113.9"
+        )
+        self.assertEqual(self.middleware(request).status_code, 200)
+
+    def test_matches_ipv6_and_single_host_entries(self):
+        for address in ("2001:db8::1", "198.51.100.7"):
+            request = self.anonymous_get("/admin/", REMOTE_ADDR=address)
+            self.assertEqual(self.middleware(request).status_code, 200, address)
+
+    def test_rejects_neighbouring_addresses(self):
+        for address in ("11.0.0.1", "198.51.100.8", "2001:db9::1"):
+            request = self.anonymous_get("/admin/", REMOTE_ADDR=address)
+            with patch("core.middleware.record_security_event"):
+                self.assertEqual(self.middleware(request).status_code, 403, address)
+
+    def test_rejection_parses_client_ip_once(self):
+        request = self.anonymous_get("/admin/", REMOTE_ADDR="203.0.113.9")
+        with patch.object(
+            self.middleware, "_parse_client_ip", wraps=self.middleware._parse_client_ip
+        ) as parse, patch("core.middleware.record_security_event") as record:
+            response = self.middleware(request)
+        self.assertEqual(response.status_code, 403)
+        parse.assert_called_once()
+        self.assertEqual(record.call_args.kwargs["metadata"]["ip"], "203.0.113.9")
+
+
+@override_settings(
+    ADMIN_ALLOWED_IPS=["10.0.0.0/8"],
+    ADMIN_ALLOWED_COUNTRIES=[],
+    SECURITY_SUSPICIOUS_PATH_KEYWORDS=[".php"],
+    SESSION_IDLE_TIMEOUT_SECONDS=600,
+)
+class CombinedSecurityMiddlewareTests(AnonymousRequestMixin, SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = CombinedSecurityMiddleware(_ok)
+
+    def test_blocks_admin_request_before_view(self):
+        view_calls = []
+        middleware = CombinedSecurityMiddleware(lambda request: view_calls.append(request) or HttpResponse())
+        with patch("core.middleware.record_security_event") as record:
+            response = middleware(self.anonymous_get("/admin/", REMOTE_ADDR="203.0.113.9"))
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(view_calls, [])
+        self.assertEqual(record.call_args.args[0], "admin.access_blocked")
+
+    def test_monitors_view_response(self):
+        with patch("core.middleware.record_security_event") as record:
+            response = self.middleware(self.anonymous_get("/index.php"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(record.call_args.args[0], "traffic.suspicious_path")
+
+    def test_static_requests_skip_all_checks(self):
+        request = self.factory.get("/static/index.php")
+        request.user = SimpleNamespace(is_authenticated=True, pk=1)
+        request.session = SessionBase()
+        with patch("core.middleware.record_security_event") as record:
+            self.middleware(request)
+        record.assert_not_called()
+        self.assertNotIn(SessionIdleTimeoutMiddleware.SESSION_KEY, request.session)
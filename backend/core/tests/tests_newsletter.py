@@ -1,6 +1,8 @@
 import json
+from unittest.mock import patch
 
 from django.core import mail
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 
 from django.test import override_settings
@@ -42,13 +44,31 @@ class NewsletterSubscribeTests(TestCase):
         self.assertEqual(subscriber.source, "homepage")
         self.assertEqual(len(mail.outbox), 0)
 
+    def test_save_normalises_new_email_and_skips_revalidation_on_update(self):
+        subscriber = NewsletterSubscriber.objects.create(email="  Reader@Example.COM ")
+        self.assertEqual(subscriber.email, "reader@example.com")
+
+        stored = NewsletterSubscriber.objects.get(pk=subscriber.pk)
+        stored.source = "footer"
+        with patch("core.models.validate_email") as validate:
+            stored.save()
+            validate.assert_not_called()
+            stored.email = "Other@Example.com"
+            stored.save()
+            validate.assert_called_once_with("other@example.com")
+
+    def test_database_rejects_mixed_case_duplicates(self):
+        NewsletterSubscriber.objects.create(email="reader@example.com")
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            NewsletterSubscriber.objects.bulk_create([NewsletterSubscriber(email="Reader@Example.com")])
+
     def test_invalid_email_rejected(self):
         response = self.post_subscribe({"email": "not-an-email", "source": "homepage"})
         self.assertEqual(response.status_code, 422)
         self.assertEqual(NewsletterSubscriber.objects.count(), 0)
 
 
-@override_settings(SITE_URL="https://skinmatch.test")
+@override_settings(SITE_URL="https://skinmatch.test", NEWSLETTER_ANNOUNCE_ASYNC=False)
 class NewsletterSkinFactTopicTests(TestCase):
     def setUp(self):
         self.sub_one = NewsletterSubscriber.objects.create(email="reader1@example.com")
@@ -65,7 +85,8 @@ class NewsletterSkinFactTopicTests(TestCase):
             "is_published": True,
         }
         defaults.update(overrides)
-        return SkinFactTopic.objects.create(**defaults)
+        with self.captureOnCommitCallbacks(execute=True):
+            return SkinFactTopic.objects.create(**defaults)
 
     def test_sends_email_for_new_topic(self):
         self._create_topic()
@@ -79,6 +100,42 @@ class NewsletterSkinFactTopicTests(TestCase):
             if html_variants:
                 self.assertIn("unsubscribe", html_variants[0][0])
 
+    def test_each_recipient_gets_own_unsubscribe_link(self):
+        self._create_topic()
+        for message in mail.outbox:
+            link = f"https://skinmatch.test/newsletter/unsubscribe?email={message.to[0].replace('@', '%40')}"
+            self.assertIn(link, message.body)
+            self.assertIn(link, message.alternatives[0][0])
+            self.assertNotIn("\x00", message.body)
+
+    def test_blank_addresses_are_skipped(self):
+        NewsletterSubscriber.objects.bulk_create([NewsletterSubscriber(email="")])
+        self._create_topic()
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_announcement_reuses_one_mail_connection(self):
+        with patch("core.signals.get_connection", wraps=mail.get_connection) as get_connection:
+            self._create_topic()
+        get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_announcement_waits_for_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            SkinFactTopic.objects.create(
+                slug="barrier", title="Barrier", section=SkinFactTopic.Section.KNOWLEDGE
+            )
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(len(callbacks), 1)
+
+    @override_settings(NEWSLETTER_ANNOUNCE_ASYNC=True)
+    def test_async_announcement_runs_in_background_thread(self):
+        with patch("core.signals.threading.Thread") as thread:
+            topic = self._create_topic()
+        thread.assert_called_once()
+        self.assertEqual(thread.call_args.kwargs["args"], (topic,))
+        thread.return_value.start.assert_called_once()
+        self.assertEqual(len(mail.outbox), 0)
+
     def test_draft_topic_does_not_send(self):
         self._create_topic(is_published=False)
         self.assertEqual(len(mail.outbox), 0)
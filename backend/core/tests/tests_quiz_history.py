@@ -169,3 +169,18 @@ def test_delete_history_removes_profile_and_session():
     history_after = client.get("/api/quiz/history")
     assert history_after.status_code == 200
     assert history_after.json() == []
+
+
+@pytest.mark.django_db
+def test_without_snapshots_defers_quiz_json():
+    user = User.objects.create_user(username="cara", email="cara@example.com", password="pass1234")
+    SkinProfile.objects.create(
+        user=user,
+        primary_concerns=["acne"],
+        answer_snapshot={"answers": ["x" * 2048]},
+        result_summary={"summary": {"primary_concerns": ["acne"]}},
+    )
+
+    profile = SkinProfile.objects.without_snapshots().get(user=user, is_latest=True)
+    assert profile.get_deferred_fields() == {"answer_snapshot", "result_summary"}
+    assert profile.primary_concerns == ["acne"]
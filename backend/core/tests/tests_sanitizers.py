@@ -0,0 +1,67 @@
+import html
+import threading
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from core import sanitizers
+from core.sanitizers import sanitize_basic_markup, sanitize_metadata_dict, sanitize_plain_text
+
+
+class SanitizerTests(SimpleTestCase):
+    def test_plain_text_strips_tags_and_unescapes(self):
+        self.assertEqual(
+            sanitize_plain_text("  <b>Glow</b> &amp; <script>alert('x')</script> shine "),
+            "Glow & alert('x') shine",
+        )
+
+    def test_basic_markup_keeps_allowed_tags_only(self):
+        self.assertEqual(
+            sanitize_basic_markup('<b>Bold</b> <a href="javascript:alert(1)">x</a><img src=x>'),
+            "<b>Bold</b> <a>x</a>",
+        )
+
+    def test_blank_input_returns_empty_string(self):
+        for value in (None, "", "   \n"):
+            self.assertEqual(sanitize_plain_text(value), "")
+            self.assertEqual(sanitize_basic_markup(value), "")
+
+    def test_plain_text_without_markup_skips_bleach(self):
+        with patch.object(sanitizers, "_get_cleaner") as get_cleaner:
+            self.assertEqual(sanitize_plain_text("  203.0.113.9 "), "203.0.113.9")
+            self.assertEqual(sanitize_plain_text("Mozilla/5.0 (X11; Linux) a > b"), "Mozilla/5.0 (X11; Linux) a > b")
+        get_cleaner.assert_not_called()
+        self.assertEqual(sanitize_plain_text("Tom &amp; Jerry"), "Tom & Jerry")
+
+        # Control characters still go through bleach, which drops or normalises them.
+        cleaner = sanitizers._get_cleaner("plain")
+        for value in ("hello\x00world", "line one\r\nline two", "form\x0cfeed", "tab\tand\nnewline"):
+            with self.subTest(value=value):
+                expected = html.unescape(cleaner.clean(value)).strip()
+                self.assertEqual(sanitize_plain_text(value), expected)
+        self.assertEqual(sanitize_plain_text("hello\x00world"), "helloworld")
+        self.assertEqual(sanitize_plain_text("a\r\nb"), "a\nb")
+
+    def test_metadata_values_are_cleaned(self):
+        self.assertEqual(
+            sanitize_metadata_dict({"<i>name</i>": "<b>Dewy</b>", "count": 3, "skip": None}),
+            {"name": "Dewy", "count": "3"},
+        )
+
+    def test_metadata_keys_do_not_mark_values_as_trusted(self):
+        # Feedback metadata is client-supplied, so an "ip" key is no guarantee of a safe value.
+        self.assertEqual(
+            sanitize_metadata_dict({"ip": "<script>x</script>203.0.113.9", "user_id": "<b>7</b>"}),
+            {"ip": "x203.0.113.9", "user_id": "7"},
+        )
+
+    def test_cleaner_is_reused_within_a_thread_only(self):
+        first = sanitizers._get_cleaner("plain")
+        self.assertIs(sanitizers._get_cleaner("plain"), first)
+        self.assertIsNot(sanitizers._get_cleaner("markup"), first)
+
+        other = []
+        worker = threading.Thread(target=lambda: other.append(sanitizers._get_cleaner("plain")))
+        worker.start()
+        worker.join()
+        self.assertIsNot(other[0], first)
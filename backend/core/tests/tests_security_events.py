@@ -0,0 +1,66 @@
+import logging
+import threading
+from unittest.mock import patch
+
+from django.core import mail
+from django.test import SimpleTestCase, override_settings
+
+from core import security_events
+from core.security_events import record_security_event
+
+
+@override_settings(SECURITY_ALERT_EMAILS=["soc@example.com"], SECURITY_ALERT_MIN_LEVEL="ERROR")
+class SecurityAlertTests(SimpleTestCase):
+    def test_alert_is_sent_from_background_worker(self):
+        record_security_event("admin.access_blocked", "warning", "blocked", force_alert=True)
+        security_events._ALERT_QUEUE.join()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, "[Security] admin.access_blocked (WARNING)")
+        self.assertEqual(mail.outbox[0].to, ["soc@example.com"])
+
+    def test_forced_alert_does_not_wait_for_delivery(self):
+        release = threading.Event()
+        delivered = threading.Event()
+
+        def slow_send(*args):
+            release.wait(5)
+            delivered.set()
+
+        with patch.object(security_events, "_send_alert", side_effect=slow_send) as send:
+            record_security_event("traffic.anomaly", "error", "slow smtp", force_alert=True)
+            self.assertFalse(delivered.is_set())
+            release.set()
+            security_events._ALERT_QUEUE.join()
+        send.assert_called_once()
+        self.assertTrue(delivered.is_set())
+
+    @override_settings(SECURITY_ALERT_ASYNC=False)
+    def test_synchronous_mode_sends_inline(self):
+        record_security_event("traffic.anomaly", "error", "too many 404s", metadata={"ip": "203.0.113.9"})
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("- ip: 203.0.113.9", mail.outbox[0].body)
+
+    @override_settings(SECURITY_ALERT_EMAILS=[])
+    def test_severity_is_case_insensitive(self):
+        with self.assertLogs("security", level="INFO") as logs:
+            record_security_event("auth.login_failed", "Warning", "mixed case")
+            record_security_event("auth.login_failed", "ERROR", "upper case")
+            record_security_event("auth.login_failed", "bogus", "unknown")
+        self.assertEqual(
+            [(record.levelno, record.severity) for record in logs.records],
+            [(logging.WARNING, "WARNING"), (logging.ERROR, "ERROR"), (logging.INFO, "BOGUS")],
+        )
+
+    @override_settings(SECURITY_ALERT_EMAILS=[])
+    def test_disabled_logger_without_alerting_is_a_no_op(self):
+        logger = logging.getLogger("security")
+        with patch.object(logger, "isEnabledFor", return_value=False), patch.object(
+            logger, "log"
+        ) as log, patch.object(security_events, "_maybe_alert") as maybe_alert:
+            record_security_event("auth.login_success", "info", "ok", metadata={"ip": "203.0.113.9"})
+        log.assert_not_called()
+        maybe_alert.assert_not_called()
+
+    def test_events_below_threshold_do_not_alert(self):
+        record_security_event("auth.login_success", "info", "ok")
+        self.assertEqual(len(mail.outbox), 0)
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+from django.contrib.admin.models import ADDITION, LogEntry
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+User = get_user_model()
+
+
+class AdminChangeSignalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username="auditor", password="pass1234", is_staff=True)
+        cls.content_type = ContentType.objects.get_for_model(User)
+
+    def setUp(self):
+        cache.clear()
+
+    def log(self):
+        return LogEntry.objects.create(
+            user_id=self.admin.pk,
+            content_type=self.content_type,
+            object_id=str(self.admin.pk),
+            object_repr="auditor",
+            action_flag=ADDITION,
+            change_message='[{"added": {}}]',
+        )
+
+    def test_admin_action_event_carries_username(self):
+        with patch("core.security_signals.record_security_event") as record:
+            self.log()
+        metadata = record.call_args.kwargs["metadata"]
+        self.assertEqual(metadata["user"], "auditor")
+        self.assertEqual(metadata["action_flag"], "Added.")
+        self.assertEqual(record.call_args.args[2], "Admin action by auditor: Added.")
+
+    def test_repeat_actions_reuse_cached_username(self):
+        with patch("core.security_signals.record_security_event"):
+            self.log()
+            # Only the LogEntry INSERT remains once the username is cached.
+            with self.assertNumQueries(1):
+                self.log()
+
+    def test_skipped_service_account_emits_no_event(self):
+        with override_settings(SECURITY_ADMIN_LOG_SKIP_USER_IDS=[str(self.admin.pk)]), patch(
+            "core.security_signals.record_security_event"
+        ) as record, self.assertNumQueries(1):
+            self.log()
+        record.assert_not_called()
@@ -0,0 +1,76 @@
+import ipaddress
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from core.security_utils import bump_counter, get_client_ip, ip_in_networks, parse_ip_networks
+
+
+class GetClientIpTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_first_forwarded_address_wins(self):
+        request = self.factory.get("/", HTTP_X_FORWARDED_FOR="203.0.113.9, 10.0.0.1")
+        self.assertEqual(get_client_ip(request), "203.0.113.9")
+
+    @override_settings(ADMIN_TRUSTED_IP_HEADERS=["REMOTE_ADDR"])
+    def test_trusted_headers_follow_settings(self):
+        request = self.factory.get("/", HTTP_X_FORWARDED_FOR="203.0.113.9", REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(get_client_ip(request), "10.0.0.1")
+
+
+class IpNetworkTests(SimpleTestCase):
+    def test_parse_skips_invalid_entries(self):
+        networks = parse_ip_networks(["10.0.0.0/8", "bogus", "", "2001:db8::1"])
+        ten = int(ipaddress.ip_address("10.0.0.0"))
+        host = int(ipaddress.ip_address("2001:db8::1"))
+        self.assertEqual(networks.v4, ((ten,), (ten + 2**24,)))
+        self.assertEqual(networks.v6, ((host,), (host + 1,)))
+
+    def test_parse_merges_overlapping_and_adjacent_ranges(self):
+        networks = parse_ip_networks(["10.0.1.0/24", "10.0.0.0/16", "10.1.0.0/16", "192.0.2.1"])
+        self.assertEqual(len(networks.v4.starts), 2)
+        for address in ("10.0.0.0", "10.0.255.255", "10.1.128.1", "192.0.2.1"):
+            self.assertTrue(ip_in_networks(address, networks), address)
+        for address in ("9.255.255.255", "10.2.0.0", "192.0.2.0", "192.0.2.2"):
+            self.assertFalse(ip_in_networks(address, networks), address)
+
+    def test_parse_reuses_result_for_same_entries(self):
+        self.assertIs(parse_ip_networks(["192.0.2.0/24"]), parse_ip_networks(("192.0.2.0/24",)))
+
+    def test_ip_in_networks(self):
+        networks = parse_ip_networks(["10.0.0.0/8", "2001:db8::/32"])
+        self.assertTrue(ip_in_networks("10.2.3.4", networks))
+        self.assertTrue(ip_in_networks("2001:db8::5", networks))
+        self.assertFalse(ip_in_networks("11.0.0.1", networks))
+        self.assertFalse(ip_in_networks("not-an-ip", networks))
+        self.assertFalse(ip_in_networks(None, networks))
+
+    def test_ip_in_networks_accepts_plain_network_lists(self):
+        networks = [ipaddress.ip_network("192.0.2.0/24"), ipaddress.ip_network("::1/128")]
+        self.assertTrue(ip_in_networks(ipaddress.ip_address("192.0.2.77"), networks))
+        self.assertTrue(ip_in_networks("::1", networks))
+        self.assertFalse(ip_in_networks("::2", networks))
+
+
+class BumpCounterTests(SimpleTestCase):
+    def setUp(self):
+        cache.delete("test:bump")
+
+    def test_counts_within_window(self):
+        self.assertEqual(bump_counter("test:bump", 60), 1)
+        self.assertEqual(bump_counter("test:bump", 60), 2)
+
+    def test_existing_key_takes_a_single_cache_call(self):
+        bump_counter("test:bump", 60)
+        with patch.object(cache, "add", wraps=cache.add) as add:
+            self.assertEqual(bump_counter("test:bump", 60), 2)
+        add.assert_not_called()
+
+    def test_lost_add_race_increments_the_winner(self):
+        with patch.object(cache, "incr", side_effect=[ValueError, 5]), patch.object(
+            cache, "add", return_value=False
+        ):
+            self.assertEqual(bump_counter("test:bump", 60), 5)
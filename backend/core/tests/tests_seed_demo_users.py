@@ -0,0 +1,69 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.models import SkinProfile
+from quiz.models import MatchPick, ProductReview, QuizSession
+
+User = get_user_model()
+
+DEMO_USERNAMES = ["skinmatch_admin", "Testuser001", "Testuser002", "Testuser003"]
+
+
+class SeedDemoUsersCommandTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command("load_sample_catalog", stdout=StringIO())
+
+    def seed(self, *args):
+        call_command("seed_demo_users", *args, stdout=StringIO(), stderr=StringIO())
+
+    def test_seeds_accounts_history_and_reviews(self):
+        self.seed()
+
+        self.assertEqual(User.objects.filter(username__in=DEMO_USERNAMES).count(), 4)
+        admin = User.objects.get(username="skinmatch_admin")
+        self.assertTrue(admin.is_superuser)
+        self.assertTrue(admin.check_password("AdminPass#123"))
+        self.assertEqual(admin.profile.role, "admin")
+        self.assertIsNotNone(admin.profile.terms_accepted_at)
+
+        member = User.objects.get(username="Testuser001")
+        session = QuizSession.objects.get(user=member)
+        picks = list(MatchPick.objects.filter(session=session).order_by("rank"))
+        self.assertEqual(len(picks), 8)
+        self.assertEqual(picks[0].product_slug, "lululun-precious-red-face-mask")
+        self.assertEqual(
+            [reco["slug"] for reco in session.result_summary["recommendations"]],
+            [pick.product_slug for pick in picks],
+        )
+        self.assertEqual(SkinProfile.objects.filter(user=member).count(), 1)
+        reviews = ProductReview.objects.filter(user=member).select_related("product")
+        self.assertEqual(reviews.count(), 2)
+        for review in reviews:
+            self.assertGreaterEqual(review.product.review_count, 1)
+            self.assertIsNotNone(review.product.rating)
+
+    def test_rerun_is_idempotent(self):
+        self.seed()
+        self.seed("--reset-passwords")
+
+        self.assertEqual(QuizSession.objects.filter(user__username__in=DEMO_USERNAMES).count(), 3)
+        self.assertEqual(ProductReview.objects.filter(user__username__in=DEMO_USERNAMES).count(), 8)
+        self.assertTrue(User.objects.get(username="Testuser002").check_password("RoutinePass#123"))
+
+    def test_reset_passwords_restores_changed_password(self):
+        self.seed()
+        member = User.objects.get(username="Testuser003")
+        member.set_password("SomethingElse#1")
+        member.save(update_fields=["password"])
+
+        self.seed()
+        member.refresh_from_db()
+        self.assertFalse(member.check_password("FreshPass#123"))
+
+        self.seed("--reset-passwords")
+        member.refresh_from_db()
+        self.assertTrue(member.check_password("FreshPass#123"))
@@ -1,7 +1,11 @@
+import json
 import shutil
 import tempfile
+from io import StringIO
+from pathlib import Path
 
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
 from django.test import RequestFactory, TestCase, override_settings
 
 from core.api import _resolve_media_url, _serialize_fact_block, _serialize_fact_topic_summary
@@ -110,3 +114,30 @@ class SkinFactSerializationTests(TestCase):
 
         self.assertIsNone(payload.image_alt)
         self.assertTrue(payload.image_url.endswith(".jpg"))
+
+
+class ExportSkinFactSeedTests(TestCase):
+    def test_export_prefetches_ordered_blocks(self):
+        for idx in range(3):
+            topic = SkinFactTopic.objects.create(
+                slug=f"export-{idx}", title=f"Export {idx}", section=SkinFactTopic.Section.KNOWLEDGE
+            )
+            for order in (2, 0, 1):
+                SkinFactContentBlock.objects.create(topic=topic, order=order, content=f"Block {order}")
+
+        out_dir = Path(tempfile.mkdtemp(prefix="facts_export_"))
+        self.addCleanup(shutil.rmtree, out_dir, ignore_errors=True)
+        output = out_dir / "seed.json"
+        with self.assertNumQueries(2):  # topics + one prefetch for every topic's blocks
+            call_command(
+                "export_skinfact_seed",
+                output=str(output),
+                media_dir=str(out_dir / "media"),
+                stdout=StringIO(),
+            )
+
+        payload = json.loads(output.read_text(encoding="utf-8"))
+        topics = payload["topics"]
+        self.assertEqual(len(topics), 3)
+        for topic in topics:
+            self.assertEqual([block["order"] for block in topic["content_blocks"]], [0, 1, 2])
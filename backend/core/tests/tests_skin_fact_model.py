@@ -1,4 +1,4 @@
-import shutil, tempfile
+import shutil, tempfile, time, uuid
 from datetime import timedelta
 
 from django.test import TestCase, override_settings
@@ -7,7 +7,7 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
-from core.models import SkinFactTopic, SkinFactContentBlock, SkinFactView
+from core.models import SkinFactTopic, SkinFactContentBlock, SkinFactView, uuid7
 
 User = get_user_model()
 
@@ -55,9 +55,19 @@ class SkinFactModelTest(TestCase):
         topic = SkinFactTopic.objects.create(
             slug="vitc", title="Vitamin C", section=SkinFactTopic.Section.FACT_CHECK
         )
-        SkinFactView.objects.create(topic=topic, user=self.user)
+        view = SkinFactView.objects.create(topic=topic, user=self.user)
         topic.refresh_from_db()
         self.assertEqual(topic.view_count, 1)
+        # viewed_at is filled in by the database and returned from the INSERT.
+        self.assertLessEqual(view.viewed_at, timezone.now())
+
+    def test_uuid7_is_time_ordered(self):
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        self.assertEqual(first.version, 7)
+        self.assertEqual(first.variant, uuid.RFC_4122)
+        self.assertLess(first, second)
 
     def test_content_block_paragraph_requires_text(self):
         topic = SkinFactTopic.objects.create(
@@ -174,3 +184,13 @@ class PopularFactsAPITest(TestCase):
             fallback_topics[2].slug,
         ]
         self.assertEqual([item["slug"] for item in payload], expected_slugs)
+
+    def test_topic_detail_reports_incremented_view_count(self):
+        topic = self._create_topic("detail-topic", "Detail Topic", view_count=7)
+
+        resp = self.client.get(f"/api/facts/topics/{topic.slug}")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["view_count"], 8)
+        topic.refresh_from_db()
+        self.assertEqual(topic.view_count, 8)
+        self.assertEqual(SkinFactView.objects.filter(topic=topic, user=self.user).count(), 1)
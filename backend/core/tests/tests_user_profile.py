@@ -17,6 +17,16 @@ class UserProfileModelTest(TestCase):
         self.assertEqual(prof.full_name, "Alice Wong")
         self.assertIn("Profile of", str(prof))
 
+    def test_has_role_ignores_case(self):
+        prof, _ = UserProfile.objects.get_or_create(user=self.user)
+        # Rows written outside the choices (e.g. by hand in the DB) may be mixed-case.
+        UserProfile.objects.filter(pk=prof.pk).update(role="Admin")
+        prof.refresh_from_db()
+        self.assertTrue(prof.has_role(UserProfile.Role.ADMIN))
+        self.assertTrue(prof.has_role("STAFF", "ADMIN"))
+        self.assertFalse(prof.has_role(UserProfile.Role.STAFF))
+        self.assertFalse(prof.has_role())
+
     def test_age_property(self):
         dob = date.today().replace(year=date.today().year - 20) + timedelta(days=1)
         prof, _ = UserProfile.objects.get_or_create(user=self.user)
@@ -24,6 +34,23 @@ class UserProfileModelTest(TestCase):
         prof.save()
         self.assertEqual(prof.age, 19)
 
+    def test_age_follows_date_of_birth_changes(self):
+        prof, _ = UserProfile.objects.get_or_create(user=self.user)
+        self.assertIsNone(prof.age)
+        prof.date_of_birth = date.today().replace(year=date.today().year - 20) - timedelta(days=1)
+        self.assertEqual(prof.age, 20)
+
+    def test_new_user_gets_profile_with_a_single_insert(self):
+        with self.assertNumQueries(2):  # auth_user INSERT + core_userprofile INSERT
+            user = User.objects.create_user(username="carol", password="12345")
+        self.assertTrue(UserProfile.objects.filter(user=user).exists())
+
+    def test_age_increments_on_birthday(self):
+        prof, _ = UserProfile.objects.get_or_create(user=self.user)
+        # A 20-year offset keeps Feb 29 valid (both years are leap years).
+        prof.date_of_birth = date.today().replace(year=date.today().year - 20)
+        self.assertEqual(prof.age, 20)
+
 class SkinProfileModelTest(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
@@ -967,7 +967,8 @@ def delete_history_item(request, history_id: uuid.UUID):
         raise HttpError(401, "Authentication required")
 
     profile = (
-        SkinProfile.objects.select_related("session")
+        SkinProfile.objects.without_snapshots()
+        .select_related("session")
         .filter(user=user)
         .filter(Q(id=history_id) | Q(session_id=history_id))
         .first()
@@ -986,13 +987,14 @@ def delete_history_item(request, history_id: uuid.UUID):
         if session:
             session.delete()
         if was_latest:
-            replacement = (
+            replacement_id = (
                 SkinProfile.objects.filter(user=user)
                 .order_by("-created_at")
+                .values_list("pk", flat=True)
                 .first()
             )
-            if replacement:
-                SkinProfile.objects.filter(pk=replacement.pk).update(is_latest=True)
+            if replacement_id:
+                SkinProfile.objects.filter(pk=replacement_id).update(is_latest=True)
 
     return HistoryDeleteAck(
         ok=True,
@@ -1548,6 +1550,7 @@ def calculate_results(session: QuizSession, *, include_products: bool) -> dict:
     session.picks.all().delete()
 
     picks_payload: list[dict] = []
+    picks: list[MatchPick] = []
     if include_products:
         for rank, recommendation in enumerate(recommendations, start=1):
             product = recommendation.product
@@ -1556,21 +1559,23 @@ def calculate_results(session: QuizSession, *, include_products: bool) -> dict:
             image_url = _product_image_url(product)
             purchase_url = _sanitize_product_url(product.product_url)
             average_rating_value, review_count = _derive_review_stats(product)
-            MatchPick.objects.create(
-                session=session,
-                product=product,
-                product_slug=product.slug,
-                product_name=product.name,
-                brand=product.brand,
-                category=product.category,
-                rank=rank,
-                score=recommendation.score,
-                ingredients=recommendation.ingredients,
-                price_snapshot=display_price,
-                currency=display_currency,
-                rationale=recommendation.rationale,
-                image_url=image_url or "",
-                product_url=purchase_url or "",
+            picks.append(
+                MatchPick(
+                    session=session,
+                    product=product,
+                    product_slug=product.slug,
+                    product_name=product.name,
+                    brand=product.brand,
+                    category=product.category,
+                    rank=rank,
+                    score=recommendation.score,
+                    ingredients=recommendation.ingredients,
+                    price_snapshot=display_price,
+                    currency=display_currency,
+                    rationale=recommendation.rationale,
+                    image_url=image_url or "",
+                    product_url=purchase_url or "",
+                )
             )
 
             picks_payload.append(
@@ -1593,6 +1598,7 @@ def calculate_results(session: QuizSession, *, include_products: bool) -> dict:
                     "review_count": review_count,
                 }
             )
+        MatchPick.objects.bulk_create(picks)
 
     summary_payload = {
         **summary,